@@ -2,7 +2,8 @@
 
 from pathlib import Path
 from ..core.registry import auto_discover_components
+from ..settings import cache_dir
 
-# Auto-discover all components in this package
+# Auto-discover all components in this package (module list cached per layout)
 _components_dir = Path(__file__).parent
-_discovered = auto_discover_components(_components_dir)
+_discovered = auto_discover_components(_components_dir, cache_path=cache_dir / "component_modules.json")
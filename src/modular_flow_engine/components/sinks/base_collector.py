@@ -22,6 +22,9 @@ class CollectorSink(Component):
     - "return": Include in API response (ExecutionResult.returns)
     - "file": Write to JSON file (requires path config)
     - "console": Print to stdout
+
+    Between calls, the returned `items` list is the collector's internal
+    buffer and must not be mutated; the finalization call returns a copy.
     """
 
     def __init__(self, instance_id: str, config: dict[str, Any]):
@@ -81,7 +84,7 @@ class CollectorSink(Component):
 
         if fields:
             # Collect only specified fields
-            item = {k: inputs.get(k) for k in fields if k in inputs}
+            item = {k: inputs[k] for k in fields if k in inputs}
         else:
             # Collect all inputs
             item = dict(inputs)
@@ -89,9 +92,11 @@ class CollectorSink(Component):
         if item:  # Only add non-empty items
             self._collected.append(item)
 
-        # Build result data
+        # Build result data. Intermediate calls (inside loops) expose the live
+        # buffer instead of copying it every time - treat it as read-only.
+        # Finalization hands out a snapshot since that is what gets written.
         data = {
-            "items": list(self._collected),
+            "items": self._collected if inputs else list(self._collected),
             "count": len(self._collected),
         }
 
@@ -101,15 +106,13 @@ class CollectorSink(Component):
             self._finalized = True
             destinations = self.get_config("destinations", ["return"])
 
-            for dest in destinations:
-                if dest == "file":
-                    path = self.get_config("path", f"{self.instance_id}_results.json")
-                    context.write(data, to="file", path=path)
-                elif dest == "return":
-                    # Use instance_id as key in return space
-                    context.write({self.instance_id: data}, to="return")
-                elif dest == "console":
-                    context.write(data, to="console")
+            # Use instance_id as key in return space
+            context.write_multi(
+                data,
+                destinations,
+                path=self.get_config("path", f"{self.instance_id}_results.json"),
+                return_key=self.instance_id,
+            )
 
         return data
 
@@ -119,5 +122,5 @@ class CollectorSink(Component):
 
     def clear(self) -> None:
         """Clear collected items."""
-        self._collected.clear()
+        self._collected = []  # Earlier calls may still hold the old buffer
         self._finalized = False
@@ -2,14 +2,105 @@
 
 from __future__ import annotations
 
+import asyncio
 import csv
+import io
+import sys
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from ...core.component import Component, ComponentManifest, ConfigSpec, InputSpec, OutputSpec, ValidationResult
-from ...core.context import ExecutionContext
+from ...core.context import ExecutionContext, open_output
 from ...core.registry import register_component
 
+# Large write buffer so row emissions batch into few write(2) calls
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+def _format_plain_rows(items: list[Any], columns: list[str]) -> bytearray | None:
+    """
+    Format header and rows as CSV bytes without the csv module.
+
+    Produces exactly what csv.writer would (excel dialect, CRLF line endings)
+    as long as no cell needs quoting. Returns None if any cell contains a
+    comma, quote or newline, so the caller can fall back to csv.writer.
+    """
+    buf = bytearray()
+    for row in _plain_rows(items, columns):
+        # Rows differ in width (non-dict items are single cells)
+        separators = len(row) - 1
+        line = ",".join(row)
+        if line.count(",") != separators or '"' in line or "\n" in line or "\r" in line:
+            return None
+        # csv.writer quotes a lone empty field so the row isn't blank
+        if not line and not separators:
+            return None
+        buf += line.encode("utf-8")
+        buf += b"\r\n"
+    return buf
+
+
+def _plain_rows(items: list[Any], columns: list[str]) -> Iterator[list[str]]:
+    """Yield header then rows as lists of strings (None -> "" like csv.writer)."""
+    yield columns
+    for item in items:
+        if isinstance(item, dict):
+            values = [item.get(col, "") for col in columns]
+        else:
+            values = [item]
+        yield ["" if v is None else str(v) for v in values]
+
+
+def _write_all(path: Path, buf: bytearray) -> None:
+    """Write a buffer to path with unbuffered raw writes."""
+    with open_output(path, "wb", buffering=0) as f:
+        view = memoryview(buf)
+        while view:
+            view = view[f.write(view):]
+
+
+def _write_rows(f: TextIO, items: list[Any], columns: list[str]) -> None:
+    """Write header and rows to an open text file with the csv module."""
+    if all(isinstance(item, dict) for item in items):
+        # DictWriter projects each row onto the columns inside the csv module
+        dict_writer = csv.DictWriter(f, fieldnames=columns, restval="", extrasaction="ignore")
+        dict_writer.writeheader()
+        dict_writer.writerows(items)
+    else:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+
+        # Single writerows() call - the csv module iterates the rows in C
+        writer.writerows(
+            [item.get(col, "") for col in columns] if isinstance(item, dict) else [item]
+            for item in items
+        )
+
+
+def _render(items: list[Any], columns: list[str], fast_path: bool) -> bytes:
+    """Render the whole CSV file in memory (for deferred writes)."""
+    if fast_path:
+        buf = _format_plain_rows(items, columns)
+        if buf is not None:
+            return bytes(buf)
+
+    f = io.StringIO(newline="")
+    _write_rows(f, items, columns)
+    return f.getvalue().encode("utf-8")
+
+
+def _write_sync(path: Path, items: list[Any], columns: list[str], fast_path: bool) -> None:
+    """Write items to path as CSV (blocking - run in a worker thread)."""
+    if fast_path:
+        buf = _format_plain_rows(items, columns)
+        if buf is not None:
+            _write_all(path, buf)
+            return
+
+    with open_output(path, "w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+        _write_rows(f, items, columns)
+
 
 @register_component("sink/csv_writer")
 class CsvWriterSink(Component):
@@ -37,6 +128,11 @@ class CsvWriterSink(Component):
                     required=False,
                     description="Specific columns to include (default: all)"
                 ),
+                "fast_path": ConfigSpec(
+                    type="boolean",
+                    default=False,
+                    description="Format rows without the csv module when no cell needs quoting"
+                ),
             },
             inputs={
                 "items": InputSpec(
@@ -88,20 +184,17 @@ class CsvWriterSink(Component):
                 columns = list(first_item.keys())
             else:
                 columns = ["value"]
-
-        # Write CSV
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(columns)
-
-            for item in items:
-                if isinstance(item, dict):
-                    row = [item.get(col, "") for col in columns]
-                else:
-                    row = [item]
-                writer.writerow(row)
+        else:
+            # Configured names come from plan JSON as fresh strings; interning
+            # lets per-row dict lookups match item keys by identity
+            columns = [sys.intern(c) if type(c) is str else c for c in columns]
+
+        # Write off the event loop, or queue until the flow ends (settings.defer_writes)
+        fast_path = self.get_config("fast_path", False)
+        if context.get_setting("defer_writes", False):
+            context.queue_write(path, _render(items, columns, fast_path))
+        else:
+            await asyncio.to_thread(_write_sync, path, items, columns, fast_path)
 
         self.report(f"  ✓ CSV: {len(items)} rows → {path.name}", context)
 
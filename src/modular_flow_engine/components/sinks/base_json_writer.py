@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import asyncio
+import json
+import time
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
+
+try:
+    import orjson  # Optional: faster per-item encoding for streamed formats
+except ImportError:
+    orjson = None
 
 from ...core.component import Component, ComponentManifest, ConfigSpec, InputSpec, OutputSpec
-from ...core.context import ExecutionContext
+from ...core.context import ExecutionContext, open_output
 from ...core.registry import register_component
 
+# Streamed entries accumulate in a reused buffer, flushed once it passes this size
+_FLUSH_SIZE = 128 * 1024
+
 
 @register_component("sink/json_writer")
 class JsonWriterSink(Component):
@@ -23,12 +33,32 @@ class JsonWriterSink(Component):
     - "file": Write to JSON file (default, always enabled)
     - "return": Also include in API response
     - "console": Also print to stdout
+
+    Formats:
+    - "json": Buffer everything, write one {"results", "metadata"} document
+    - "ndjson": Stream one JSON object per line as items arrive
+    - "array": Stream a bare JSON array of items as they arrive
+
+    The streamed formats keep memory flat: items are written to the open
+    file on each call and only retained if a non-file destination needs them.
+    They write as items arrive, so settings.defer_writes does not apply.
     """
 
     def __init__(self, instance_id: str, config: dict[str, Any]):
         super().__init__(instance_id, config)
         self._collected: list[dict[str, Any]] = []
+        self._count = 0
         self._finalized = False
+        self._fh: BinaryIO | None = None
+        self._buf = bytearray()
+        # Serializes streamed file I/O (which runs in worker threads) across concurrent calls
+        self._io_lock = asyncio.Lock()
+
+        self._format = self.get_config("format", "json")
+        destinations = self.get_config("destinations", ["file"])
+        self._streaming = self._format != "json" and "file" in destinations
+        # Streamed items only need to stay in memory for return/console output
+        self._keep_items = not self._streaming or any(d != "file" for d in destinations)
 
     @classmethod
     def describe(cls) -> ComponentManifest:
@@ -58,6 +88,12 @@ class JsonWriterSink(Component):
                     default=["file"],
                     description="Where to write output: 'file' (default), 'return', 'console'"
                 ),
+                "format": ConfigSpec(
+                    type="string",
+                    default="json",
+                    choices=["json", "ndjson", "array"],
+                    description="File layout: 'json' document, or streamed 'ndjson' / 'array'"
+                ),
             },
             inputs={},
             outputs={
@@ -81,44 +117,113 @@ class JsonWriterSink(Component):
         inputs: dict[str, Any],
         context: ExecutionContext
     ) -> dict[str, Any]:
-        # Collect inputs if provided
-        if inputs:
-            self._collected.append(dict(inputs))
-
         # Get configured path (context.write will resolve against output_dir)
         configured_path = self.get_config("path")
-        include_metadata = self.get_config("include_metadata", True)
 
-        # Build output structure
-        output = {
-            "results": self._collected,
-        }
-
-        if include_metadata:
-            output["metadata"] = {
-                "timestamp": datetime.now().isoformat(),
-                "count": len(self._collected),
-            }
+        # Compute actual path for return value
+        path = Path(configured_path)
+        if context.output_dir and not path.is_absolute():
+            path = context.output_dir / path
 
-        # Write to destinations on finalization
+        # Collect inputs if provided
+        if inputs:
+            item = dict(inputs)
+            if self._streaming:
+                await self._stream_item(item, path)
+            if self._keep_items:
+                self._collected.append(item)
+            self._count += 1
+
+        # Build and write output only on finalization
         if not inputs and not self._finalized:
             self._finalized = True
+
+            output = {
+                "results": self._collected,
+            }
+
+            if self.get_config("include_metadata", True):
+                output["metadata"] = {
+                    "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "count": self._count,
+                }
+
             destinations = self.get_config("destinations", ["file"])
 
-            for dest in destinations:
-                if dest == "file":
-                    context.write(output, to="file", path=configured_path)
-                elif dest == "return":
-                    context.write({self.instance_id: output}, to="return")
-                elif dest == "console":
-                    context.write(output, to="console")
+            # File I/O runs in a worker thread so concurrent steps keep running
+            if "file" in destinations:
+                if self._streaming:
+                    # The file already holds every item - just terminate it
+                    async with self._io_lock:
+                        await asyncio.to_thread(self._close_stream, path)
+                else:
+                    await asyncio.to_thread(context.write_multi, output, ["file"], path=configured_path)
+                destinations = [d for d in destinations if d != "file"]
 
-        # Compute actual path for return value
-        path = Path(configured_path)
-        if context.output_dir and not path.is_absolute():
-            path = context.output_dir / path
+            context.write_multi(output, destinations, return_key=self.instance_id)
 
         return {
             "path": str(path),
-            "count": len(self._collected),
+            "count": self._count,
         }
+
+    def _open_stream(self, path: Path) -> BinaryIO:
+        """Open the streamed output file and start the format preamble."""
+        self._buf.clear()
+        if self._format == "array":
+            self._buf += b"["
+        return open_output(path, "wb")
+
+    async def _stream_item(self, item: dict[str, Any], path: Path) -> None:
+        """Append one item to the output buffer, flushing it when it fills up."""
+        encoded = None
+        if orjson is not None:
+            try:
+                encoded = orjson.dumps(item, default=str, option=orjson.OPT_NON_STR_KEYS)
+            except orjson.JSONEncodeError:
+                pass  # e.g. ints beyond 64 bits - the json module handles those
+        if encoded is None:
+            # Compact separators, matching the orjson lines
+            encoded = json.dumps(item, ensure_ascii=False, default=str, separators=(",", ":")).encode("utf-8")
+        async with self._io_lock:
+            # Opening (mkdir included) and flushing run off the event loop
+            if self._fh is None:
+                self._fh = await asyncio.to_thread(self._open_stream, path)
+                if self._format == "array":
+                    self._buf += b"\n"
+            elif self._format == "array":
+                self._buf += b",\n"
+            self._buf += encoded
+            if self._format == "ndjson":
+                self._buf += b"\n"
+            if len(self._buf) >= _FLUSH_SIZE:
+                await asyncio.to_thread(self._fh.write, self._buf)
+                self._buf.clear()
+
+    def _close_stream(self, path: Path) -> None:
+        """Terminate, flush and close the streamed output file."""
+        if self._fh is None:
+            # Nothing was streamed - still produce a valid (empty) file
+            self._fh = self._open_stream(path)
+        elif self._format == "array":
+            self._buf += b"\n"
+        self._finish_stream()
+
+    def _finish_stream(self) -> None:
+        """Write the buffered tail (closing an array) and close the file."""
+        if self._format == "array":
+            self._buf += b"]\n"
+        try:
+            self._fh.write(self._buf)
+        finally:
+            self._fh.close()
+            self._fh = None
+            # Release the buffer's memory rather than holding it past the run
+            self._buf = bytearray()
+
+    def close(self) -> None:
+        """Keep what was streamed if the sink is dropped before finalization."""
+        if self._fh is not None:
+            if self._format == "array":
+                self._buf += b"\n"
+            self._finish_stream()
@@ -2,15 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import operator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from ...core.component import Component, ComponentManifest, ConfigSpec, InputSpec, OutputSpec, ValidationResult
-from ...core.context import ExecutionContext
+from ...core.context import ExecutionContext, write_bytes
 from ...core.registry import register_component
 
 
+def _format_cell(val: Any) -> str:
+    """Format one sample-results table cell."""
+    # Format booleans nicely
+    if type(val) is bool:
+        return "✓" if val else "✗"
+    # Truncate long strings
+    if isinstance(val, str):
+        return val[:27] + "..." if len(val) > 30 else val
+    return str(val)
+
+
 @register_component("sink/report_writer")
 class ReportWriterSink(Component):
     """
@@ -108,42 +121,51 @@ class ReportWriterSink(Component):
         lines = []
 
         # Header
-        lines.append(f"# {title}")
-        lines.append("")
-        lines.append(f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
-        lines.append("")
+        lines.extend((
+            f"# {title}",
+            "",
+            f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*",
+            "",
+        ))
 
         # Summary section
         if summary:
-            lines.append("## Summary")
-            lines.append("")
-            lines.append(f"- **Total items evaluated:** {summary.get('total_items', 'N/A')}")
-            lines.append(f"- **Overall accuracy:** {summary.get('overall_accuracy', 0) * 100:.1f}%")
-            lines.append(f"- **Total groups/questions:** {summary.get('total_groups', 'N/A')}")
-            if summary.get('best_group') is not None:
-                lines.append(f"- **Best performing:** Group {summary.get('best_group')} ({summary.get('best_accuracy', 0) * 100:.1f}%)")
+            lines.extend((
+                "## Summary",
+                "",
+                f"- **Total items evaluated:** {summary.get('total_items', 'N/A')}",
+                f"- **Overall accuracy:** {summary.get('overall_accuracy', 0) * 100:.1f}%",
+                f"- **Total groups/questions:** {summary.get('total_groups', 'N/A')}",
+            ))
+            best_group = summary.get('best_group')
+            if best_group is not None:
+                lines.append(f"- **Best performing:** Group {best_group} ({summary.get('best_accuracy', 0) * 100:.1f}%)")
             lines.append("")
 
         # Per-group performance
         if groups:
-            lines.append("## Performance by Group")
-            lines.append("")
-            lines.append("| Group | Accuracy | Correct | Total | Precision | Recall | F1 |")
-            lines.append("|-------|----------|---------|-------|-----------|--------|-----|")
+            lines.extend((
+                "## Performance by Group",
+                "",
+                "| Group | Accuracy | Correct | Total | Precision | Recall | F1 |",
+                "|-------|----------|---------|-------|-----------|--------|-----|",
+            ))
 
             # Sort by accuracy descending
             sorted_groups = sorted(groups, key=lambda g: g.get('accuracy', 0), reverse=True)
 
-            for g in sorted_groups:
-                acc = g.get('accuracy', 0) * 100
-                prec = g.get('precision', 0) * 100
-                rec = g.get('recall', 0) * 100
-                f1 = g.get('f1', 0) * 100
-                lines.append(
-                    f"| {g.get('group', 'N/A')} | {acc:.1f}% | "
-                    f"{g.get('correct', 0)} | {g.get('count', 0)} | "
-                    f"{prec:.1f}% | {rec:.1f}% | {f1:.1f}% |"
+            # One .get per field, one f-string per row
+            lines.extend(
+                f"| {grp} | {acc * 100:.1f}% | {cor} | {cnt} | "
+                f"{prec * 100:.1f}% | {rec * 100:.1f}% | {f1 * 100:.1f}% |"
+                for grp, acc, cor, cnt, prec, rec, f1 in (
+                    (
+                        g.get('group', 'N/A'), g.get('accuracy', 0), g.get('correct', 0),
+                        g.get('count', 0), g.get('precision', 0), g.get('recall', 0), g.get('f1', 0),
+                    )
+                    for g in sorted_groups
                 )
+            )
             lines.append("")
 
         # Sample results
@@ -170,19 +192,19 @@ class ReportWriterSink(Component):
                 lines.append("| " + " | ".join(available_cols) + " |")
                 lines.append("| " + " | ".join(["---"] * len(available_cols)) + " |")
 
-                # Rows
+                # Rows - fetch all cells in one C call, falling back to .get
+                # for rows missing one of the first row's columns
+                getter = operator.itemgetter(*available_cols)
+                single = len(available_cols) == 1
                 for r in results_to_show:
-                    cells = []
-                    for col in available_cols:
-                        val = r.get(col, "")
-                        # Truncate long strings
-                        if isinstance(val, str) and len(val) > 30:
-                            val = val[:27] + "..."
-                        # Format booleans nicely
-                        if isinstance(val, bool):
-                            val = "✓" if val else "✗"
-                        cells.append(str(val))
-                    lines.append("| " + " | ".join(cells) + " |")
+                    try:
+                        vals = getter(r)
+                    except KeyError:
+                        vals = tuple(r.get(col, "") for col in available_cols)
+                    else:
+                        if single:
+                            vals = (vals,)
+                    lines.append("| " + " | ".join(map(_format_cell, vals)) + " |")
 
                 lines.append("")
 
@@ -197,12 +219,12 @@ class ReportWriterSink(Component):
         lines.append("---")
         lines.append("*Report generated by dataflow-eval*")
 
-        # Write the report
-        path.parent.mkdir(parents=True, exist_ok=True)
-        content = "\n".join(lines)
-
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(content)
+        # Write off the event loop, or queue until the flow ends (settings.defer_writes)
+        payload = "\n".join(lines).encode("utf-8")
+        if context.get_setting("defer_writes", False):
+            context.queue_write(path, payload)
+        else:
+            await asyncio.to_thread(write_bytes, path, payload)
 
         self._written = True
 
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+import operator
 from typing import Any
 
 from ...core.component import Component, ComponentManifest, ConfigSpec, InputSpec, OutputSpec
 from ...core.context import ExecutionContext
 from ...core.registry import register_component
 
+# Groups are ranked by accuracy, then F1 (itemgetter builds the key tuple in C)
+_SORT_KEY = operator.itemgetter("accuracy", "f1")
+
 
 @register_component("transform/aggregator")
 class AggregatorTransform(Component):
@@ -41,6 +44,11 @@ class AggregatorTransform(Component):
                     default=None,
                     description="Field to count (count all if not specified)"
                 ),
+                "sort_results": ConfigSpec(
+                    type="boolean",
+                    default=True,
+                    description="Sort groups by accuracy (otherwise first-seen order)"
+                ),
             },
             inputs={
                 "items": InputSpec(
@@ -70,33 +78,32 @@ class AggregatorTransform(Component):
         group_by = self.get_config("group_by")
         match_field = self.get_config("match_field", "match")
 
-        # Group items
-        grouped = defaultdict(list)
+        # Single pass: per-group [count, tp, tn, fp, fn] counters
+        # (correct = tp + tn, since an item is correct exactly when it matches)
+        counters: dict[Any, list[int]] = {}
         for item in items:
-            if isinstance(item, dict):
-                key = item.get(group_by, "unknown")
-                grouped[key].append(item)
+            if not isinstance(item, dict):
+                continue
+            key = item.get(group_by, "unknown")
+            c = counters.get(key)
+            if c is None:
+                c = counters[key] = [0, 0, 0, 0, 0]
+            c[0] += 1
+            predicted = item.get("is_yes", item.get("actual"))
+            if item.get(match_field):
+                c[1 if predicted else 2] += 1
+            else:
+                c[3 if predicted else 4] += 1
 
         # Calculate stats per group
         groups = []
         total_correct = 0
         total_count = 0
 
-        for group_key, group_items in grouped.items():
-            count = len(group_items)
-            correct = sum(1 for item in group_items if item.get(match_field, False))
+        for group_key, (count, tp, tn, fp, fn) in counters.items():
+            correct = tp + tn
             accuracy = correct / count if count > 0 else 0.0
 
-            # Calculate true positives, false positives, etc. if applicable
-            tp = sum(1 for item in group_items
-                     if item.get(match_field) and item.get("is_yes", item.get("actual")))
-            tn = sum(1 for item in group_items
-                     if item.get(match_field) and not item.get("is_yes", item.get("actual")))
-            fp = sum(1 for item in group_items
-                     if not item.get(match_field) and item.get("is_yes", item.get("actual")))
-            fn = sum(1 for item in group_items
-                     if not item.get(match_field) and not item.get("is_yes", item.get("actual")))
-
             # Precision, recall, F1
             precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
             recall = tp / (tp + fn) if (tp + fn) > 0 else 0.0
@@ -119,8 +126,12 @@ class AggregatorTransform(Component):
             total_correct += correct
             total_count += count
 
-        # Sort by accuracy descending
-        groups.sort(key=lambda x: (x["accuracy"], x["f1"]), reverse=True)
+        # Sort by accuracy descending, or just find the best group
+        if self.get_config("sort_results", True):
+            groups.sort(key=_SORT_KEY, reverse=True)
+            best = groups[0] if groups else None
+        else:
+            best = max(groups, key=_SORT_KEY) if groups else None
 
         # Overall summary
         summary = {
@@ -128,8 +139,8 @@ class AggregatorTransform(Component):
             "total_groups": len(groups),
             "total_correct": total_correct,
             "overall_accuracy": round(total_correct / total_count, 4) if total_count > 0 else 0.0,
-            "best_group": groups[0]["group"] if groups else None,
-            "best_accuracy": groups[0]["accuracy"] if groups else 0.0,
+            "best_group": best["group"] if best else None,
+            "best_accuracy": best["accuracy"] if best else 0.0,
         }
 
         return {
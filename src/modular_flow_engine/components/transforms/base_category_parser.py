@@ -84,11 +84,15 @@ class CategoryParserTransform(Component):
         # Normalize for comparison
         compare_text = text if case_sensitive else text.lower()
 
+        # Index the text's words once instead of re-splitting per category
+        words = set(compare_text.split())
+        stripped = compare_text.strip()
+
         # First pass: look for exact word matches
         for cat in categories:
             compare_cat = cat if case_sensitive else cat.lower()
             # Check if category appears as a word (not substring)
-            if compare_cat in compare_text.split() or compare_text.strip() == compare_cat:
+            if compare_cat in words or stripped == compare_cat:
                 return {
                     "category": cat,
                     "matched": True,
@@ -2,12 +2,25 @@
 
 from __future__ import annotations
 
+import operator
 from typing import Any
 
 from ...core.component import Component, ComponentManifest, ConfigSpec, InputSpec, OutputSpec
 from ...core.context import ExecutionContext
 from ...core.registry import register_component
 
+# Strings coerced to booleans (after lowercasing/stripping)
+_BOOL_MAP = {"yes": True, "true": True, "1": True, "no": False, "false": False, "0": False}
+
+# Comparison per mode (unknown modes fall back to equals)
+_COMPARATORS = {
+    "equals": operator.eq,
+    "not_equals": operator.ne,
+    "contains": lambda actual, expected: str(expected) in str(actual),
+    "greater": operator.gt,
+    "less": operator.lt,
+}
+
 
 @register_component("transform/compare")
 class CompareTransform(Component):
@@ -18,6 +31,16 @@ class CompareTransform(Component):
     Supports various comparison modes and type coercion.
     """
 
+    # No awaits - the engine calls execute_sync() directly
+    is_pure_sync = True
+
+    def __init__(self, instance_id: str, config: dict[str, Any]):
+        super().__init__(instance_id, config)
+        # Config is fixed per instance - resolve it once, not on every call
+        self._compare = _COMPARATORS.get(self.get_config("mode", "equals"), operator.eq)
+        self._case_sensitive = self.get_config("case_sensitive", False)
+        self._coerce_bool = self.get_config("coerce_bool", True)
+
     @classmethod
     def describe(cls) -> ComponentManifest:
         return ComponentManifest(
@@ -74,30 +97,30 @@ class CompareTransform(Component):
         self,
         inputs: dict[str, Any],
         context: ExecutionContext
+    ) -> dict[str, Any]:
+        return self.execute_sync(inputs, context)
+
+    def execute_sync(
+        self,
+        inputs: dict[str, Any],
+        context: ExecutionContext
     ) -> dict[str, Any]:
         actual = inputs.get("actual")
         expected = inputs.get("expected")
-        mode = self.get_config("mode", "equals")
-        case_sensitive = self.get_config("case_sensitive", False)
-        coerce_bool = self.get_config("coerce_bool", True)
 
-        # Normalize values
-        actual_norm = self._normalize(actual, case_sensitive, coerce_bool)
-        expected_norm = self._normalize(expected, case_sensitive, coerce_bool)
+        # Normalize values (only strings change - skip the calls otherwise,
+        # e.g. for the common bool/number ground-truth comparison)
+        if isinstance(actual, str) or isinstance(expected, str):
+            case_sensitive = self._case_sensitive
+            coerce_bool = self._coerce_bool
+            actual_norm = self._normalize(actual, case_sensitive, coerce_bool)
+            expected_norm = self._normalize(expected, case_sensitive, coerce_bool)
+        else:
+            actual_norm = actual
+            expected_norm = expected
 
         # Compare based on mode
-        if mode == "equals":
-            match = actual_norm == expected_norm
-        elif mode == "not_equals":
-            match = actual_norm != expected_norm
-        elif mode == "contains":
-            match = str(expected_norm) in str(actual_norm)
-        elif mode == "greater":
-            match = actual_norm > expected_norm
-        elif mode == "less":
-            match = actual_norm < expected_norm
-        else:
-            match = actual_norm == expected_norm
+        match = self._compare(actual_norm, expected_norm)
 
         return {
             "match": match,
@@ -117,9 +140,6 @@ class CompareTransform(Component):
                 value = value.strip()
 
             if coerce_bool:
-                if value in ("yes", "true", "1"):
-                    return True
-                elif value in ("no", "false", "0"):
-                    return False
+                return _BOOL_MAP.get(value, value)
 
         return value
@@ -8,6 +8,8 @@ from ...core.component import Component, ComponentManifest, ConfigSpec, InputSpe
 from ...core.context import ExecutionContext
 from ...core.registry import register_component
 
+_MISSING = object()
+
 
 @register_component("transform/lookup")
 class LookupTransform(Component):
@@ -17,6 +19,9 @@ class LookupTransform(Component):
     Essential for dynamic lookups like getting ground truth for current character.
     """
 
+    # No awaits - the engine calls execute_sync() directly
+    is_pure_sync = True
+
     @classmethod
     def describe(cls) -> ComponentManifest:
         return ComponentManifest(
@@ -58,13 +63,22 @@ class LookupTransform(Component):
         self,
         inputs: dict[str, Any],
         context: ExecutionContext
+    ) -> dict[str, Any]:
+        return self.execute_sync(inputs, context)
+
+    def execute_sync(
+        self,
+        inputs: dict[str, Any],
+        context: ExecutionContext
     ) -> dict[str, Any]:
         lookup_dict = inputs.get("dict", {})
         key = inputs.get("key", "")
-        default = self.get_config("default")
 
-        found = key in lookup_dict
-        value = lookup_dict.get(key, default)
+        # Single lookup - the sentinel tells a stored None apart from a miss
+        value = lookup_dict.get(key, _MISSING)
+        found = value is not _MISSING
+        if not found:
+            value = self.get_config("default")
 
         return {
             "value": value,
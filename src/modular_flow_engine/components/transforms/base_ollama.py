@@ -6,8 +6,6 @@ import os
 import time
 from typing import Any
 
-import httpx
-
 from ...core.component import Component, ComponentManifest, ConfigSpec, InputSpec, OutputSpec
 from ...core.context import ExecutionContext
 from ...core.errors import ErrorProtocol
@@ -154,6 +152,9 @@ class OllamaTransform(Component):
         if format_mode:
             payload["format"] = format_mode
 
+        # Imported here so plans that never call Ollama don't load httpx
+        import httpx
+
         start_time = time.time()
 
         async with httpx.AsyncClient(timeout=timeout) as client:
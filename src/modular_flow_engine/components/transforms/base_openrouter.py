@@ -3,17 +3,78 @@
 from __future__ import annotations
 
 import asyncio
+import importlib.util
+import json
 import os
 import time
+import weakref
+from collections import OrderedDict
 from typing import Any
 
-import httpx
+try:
+    import orjson  # Optional: C-speed request encoding / response decoding
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    _loads = json.loads
+
+# httpx (and h2, if installed) are imported on first request, so component
+# discovery and plans that never call OpenRouter don't pay for them
+httpx = None
 
 from ...core.component import Component, ComponentManifest, ConfigSpec, InputSpec, OutputSpec
-from ...core.context import ExecutionContext
+from ...core.context import ExecutionContext, OutputMode
 from ...core.errors import ErrorProtocol
 from ...core.registry import register_component
 
+# One pooled client per event loop, so keep-alive connections (and TLS
+# sessions) are reused across calls instead of re-handshaking every request
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = weakref.WeakKeyDictionary()
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get the shared client for the running event loop, creating it on first use."""
+    global httpx
+    if httpx is None:
+        import httpx
+
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            # Optional h2 package enables HTTP/2 multiplexing
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+        _clients[loop] = client
+    return client
+
+
+# Cap on in-flight requests per event loop (OPENROUTER_CONCURRENCY, default 16)
+_CONCURRENCY = int(os.environ.get("OPENROUTER_CONCURRENCY", "16"))
+_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = weakref.WeakKeyDictionary()
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """Get the request-limiting semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(_CONCURRENCY)
+    return semaphore
+
+
+# In-memory LRU of responses keyed by (model, system_prompt, prompt, temperature, max_tokens)
+_CACHE_SIZE = 4096
+_CACHE_MAX_TEMPERATURE = 0.2
+_response_cache: OrderedDict[tuple, dict[str, Any]] = OrderedDict()
+
+
+# Static request headers; only Authorization varies per call
+_BASE_HEADERS = {"Content-Type": "application/json"}
+
 
 @register_component("transform/openrouter")
 class OpenRouterTransform(Component):
@@ -27,6 +88,17 @@ class OpenRouterTransform(Component):
     # Override default error protocol to retry on failures
     error_protocol = ErrorProtocol(on_error="retry", max_retries=3, retry_delay=2.0)
 
+    def __init__(self, instance_id: str, config: dict[str, Any]):
+        super().__init__(instance_id, config)
+        # Config is fixed per instance - resolve it once, not on every call
+        self._model = self.get_config("model")
+        self._api_key = self.get_config("api_key")
+        self._temperature = self.get_config("temperature", 0.7)
+        self._max_tokens = self.get_config("max_tokens", 1024)
+        self._timeout = self.get_config("timeout", 60.0)
+        # Higher temperatures are meant to vary, so never serve those from cache
+        self._use_cache = self.get_config("cache", True) and self._temperature <= _CACHE_MAX_TEMPERATURE
+
     @classmethod
     def describe(cls) -> ComponentManifest:
         return ComponentManifest(
@@ -59,6 +131,11 @@ class OpenRouterTransform(Component):
                     default=60.0,
                     description="Request timeout in seconds"
                 ),
+                "cache": ConfigSpec(
+                    type="boolean",
+                    default=True,
+                    description="Reuse responses for repeated requests (only at temperature <= 0.2)"
+                ),
             },
             inputs={
                 "prompt": InputSpec(
@@ -108,7 +185,7 @@ class OpenRouterTransform(Component):
         context: ExecutionContext
     ) -> dict[str, Any]:
         # Model priority: input > component config > plan settings
-        model = inputs.get("model") or self.get_config("model") or context.get_setting("model")
+        model = inputs.get("model") or self._model or context.get_setting("model")
         if not model:
             raise ValueError(
                 "No model specified. Set via:\n"
@@ -116,14 +193,14 @@ class OpenRouterTransform(Component):
                 "  2. Component config 'model'\n"
                 "  3. Plan settings 'model'"
             )
-        temperature = self.get_config("temperature", 0.7)
-        max_tokens = self.get_config("max_tokens", 1024)
-        timeout = self.get_config("timeout", 60.0)
+        temperature = self._temperature
+        max_tokens = self._max_tokens
+        timeout = self._timeout
 
         # API key priority: input > config > environment
         api_key = (
             inputs.get("api_key")
-            or self.get_config("api_key")
+            or self._api_key
             or os.environ.get("OPENROUTER_API_KEY")
         )
 
@@ -138,6 +215,15 @@ class OpenRouterTransform(Component):
         prompt = inputs.get("prompt", "")
         system_prompt = inputs.get("system_prompt")
 
+        # Identical low-temperature requests are answered from the cache
+        cache_key = (model, system_prompt, prompt, temperature, max_tokens) if self._use_cache else None
+        if cache_key is not None:
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                _response_cache.move_to_end(cache_key)
+                self.debug(f"API: cache hit for {model}", context)
+                return dict(cached)
+
         # Build messages
         messages = []
         if system_prompt:
@@ -147,44 +233,55 @@ class OpenRouterTransform(Component):
         # Make API call
         start_time = time.time()
 
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
+        client = _get_client()
+        async with _get_semaphore():
+            # Stream the body so the raw bytes go straight to the JSON decoder
+            async with client.stream(
+                "POST",
                 "https://openrouter.ai/api/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
+                headers={**_BASE_HEADERS, "Authorization": f"Bearer {api_key}"},
+                content=_dumps({
                     "model": model,
                     "messages": messages,
                     "temperature": temperature,
                     "max_tokens": max_tokens,
-                }
-            )
-
-            if response.status_code != 200:
-                error_text = response.text
-                raise RuntimeError(
-                    f"OpenRouter API error ({response.status_code}): {error_text}"
-                )
+                    "stream": False,
+                }),
+                timeout=timeout,
+            ) as response:
+                raw = await response.aread()
 
-            data = response.json()
+        if response.status_code != 200:
+            error_text = raw.decode("utf-8", errors="replace")
+            raise RuntimeError(
+                f"OpenRouter API error ({response.status_code}): {error_text}"
+            )
 
-        elapsed_ms = (time.time() - start_time) * 1000
+        data = _loads(raw)
 
         # Extract response
         choice = data.get("choices", [{}])[0]
         message = choice.get("message", {})
         response_text = message.get("content", "")
 
-        # Debug output for API calls
-        short_response = response_text[:30] + "..." if len(response_text) > 30 else response_text
-        model_short = model.split("/")[-1][:20]
-        self.debug(f"API: {model_short} → '{short_response}' ({elapsed_ms:.0f}ms)", context)
+        # Debug output for API calls (only formatted when it will be shown)
+        if context.output_mode is OutputMode.DEBUG:
+            elapsed_ms = (time.time() - start_time) * 1000
+            short_response = response_text[:30] + "..." if len(response_text) > 30 else response_text
+            model_short = model.rpartition("/")[2][:20]
+            self.debug(f"API: {model_short} → '{short_response}' ({elapsed_ms:.0f}ms)", context)
 
-        return {
+        result = {
             "response": response_text,
             "model": data.get("model", model),
             "usage": data.get("usage", {}),
             "finish_reason": choice.get("finish_reason", "unknown"),
         }
+
+        if cache_key is not None:
+            _response_cache[cache_key] = result
+            if len(_response_cache) > _CACHE_SIZE:
+                _response_cache.popitem(last=False)
+            return dict(result)
+
+        return result
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from typing import Any
 
@@ -9,6 +10,23 @@ from ...core.component import Component, ComponentManifest, ConfigSpec, InputSpe
 from ...core.context import ExecutionContext
 from ...core.registry import register_component
 
+_PLACEHOLDER_RE = re.compile(r"\{([^}]+)\}")
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_template(template: str) -> tuple[tuple[bool, str], ...]:
+    """Split a template into (is_placeholder, text) segments, cached per template."""
+    segments = []
+    pos = 0
+    for m in _PLACEHOLDER_RE.finditer(template):
+        if m.start() > pos:
+            segments.append((False, template[pos:m.start()]))
+        segments.append((True, m.group(1)))
+        pos = m.end()
+    if pos < len(template):
+        segments.append((False, template[pos:]))
+    return tuple(segments)
+
 
 @register_component("transform/template")
 class TemplateTransform(Component):
@@ -19,6 +37,11 @@ class TemplateTransform(Component):
     Useful for building prompts, combining data, etc.
     """
 
+    def __init__(self, instance_id: str, config: dict[str, Any]):
+        super().__init__(instance_id, config)
+        # Config is fixed per instance - resolve it once, not on every call
+        self._template = self.get_config("template")
+
     @classmethod
     def describe(cls) -> ComponentManifest:
         return ComponentManifest(
@@ -59,28 +82,32 @@ class TemplateTransform(Component):
         context: ExecutionContext
     ) -> dict[str, Any]:
         # Template can come from inputs or config (inputs take precedence)
-        template = inputs.get("template") or self.get_config("template")
+        template = inputs.get("template") or self._template
         if not template:
             raise ValueError("No template provided (via input or config)")
 
         values = inputs.get("values", {})
 
-        # Merge with any additional inputs (for convenience)
-        all_values = {**values}
-        for key, val in inputs.items():
-            if key != "values":
-                all_values[key] = val
-
-        def replace(m: re.Match) -> str:
-            key = m.group(1)
-            if key in all_values:
-                return str(all_values[key])
-            # Try context resolution
-            ctx_val = context.get(key)
-            if ctx_val is not None:
-                return str(ctx_val)
-            return m.group(0)  # Keep as-is if not found
-
-        result = re.sub(r"\{([^}]+)\}", replace, template)
+        # Other inputs are available too (for convenience) and take precedence
+        # over "values" - looked up in place rather than merged into a copy
+        segments = _parse_template(template)
+        if len(segments) == 1 and not segments[0][0]:
+            # Nothing to substitute
+            return {"result": template}
+
+        parts = []
+        append = parts.append
+        for is_placeholder, text in segments:
+            if not is_placeholder:
+                append(text)
+            elif text in inputs and text != "values":
+                append(str(inputs[text]))
+            elif text in values:
+                append(str(values[text]))
+            else:
+                # Try context resolution, keep as-is if not found
+                ctx_val = context.get(text)
+                append(str(ctx_val) if ctx_val is not None else "{" + text + "}")
+        result = "".join(parts)
 
         return {"result": result}
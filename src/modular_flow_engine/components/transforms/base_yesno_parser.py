@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import re
 from typing import Any
 
 from ...core.component import Component, ComponentManifest, ConfigSpec, InputSpec, OutputSpec
@@ -10,6 +9,32 @@ from ...core.context import ExecutionContext
 from ...core.registry import register_component
 
 
+def _is_word_char(char: str) -> bool:
+    """Match the regex notion of a word character (\\w)."""
+    return char.isalnum() or char == "_"
+
+
+def _starts_with_word(text: str, word: str) -> bool:
+    """True if text starts with word as a whole word (like ^word\\b)."""
+    return text.startswith(word) and (
+        len(text) == len(word) or not _is_word_char(text[len(word)])
+    )
+
+
+def _find_word(text: str, word: str) -> int:
+    """Index of the first whole-word occurrence of word (like \\bword\\b), or -1."""
+    size = len(word)
+    pos = text.find(word)
+    while pos != -1:
+        end = pos + size
+        if (pos == 0 or not _is_word_char(text[pos - 1])) and (
+            end == len(text) or not _is_word_char(text[end])
+        ):
+            return pos
+        pos = text.find(word, pos + 1)
+    return -1
+
+
 @register_component("transform/yesno_parser")
 class YesNoParserTransform(Component):
     """
@@ -80,7 +105,9 @@ class YesNoParserTransform(Component):
         if not text:
             return self._make_result("unknown", text, "low", default)
 
-        text_lower = text.lower().strip()
+        # lower() always copies; skip it when the text is already lowercase
+        stripped = text.strip()
+        text_lower = stripped if stripped.islower() else stripped.lower()
 
         if strict:
             # Exact match only
@@ -92,15 +119,19 @@ class YesNoParserTransform(Component):
                 return self._make_result("unknown", text, "low", default)
 
         # Flexible parsing
-        # High confidence: starts with yes/no
-        if re.match(r"^yes\b", text_lower):
+        # High confidence: starts with yes/no (the common case - dispatch on
+        # the first character so only one word check runs)
+        first = text_lower[:1]
+        if first == "y" and _starts_with_word(text_lower, "yes"):
             return self._make_result("yes", text, "high", default)
-        if re.match(r"^no\b", text_lower):
+        if first == "n" and _starts_with_word(text_lower, "no"):
             return self._make_result("no", text, "high", default)
 
         # Medium confidence: contains yes/no
-        has_yes = bool(re.search(r"\byes\b", text_lower))
-        has_no = bool(re.search(r"\bno\b", text_lower))
+        yes_pos = _find_word(text_lower, "yes")
+        no_pos = _find_word(text_lower, "no")
+        has_yes = yes_pos != -1
+        has_no = no_pos != -1
 
         if has_yes and not has_no:
             return self._make_result("yes", text, "medium", default)
@@ -109,9 +140,8 @@ class YesNoParserTransform(Component):
 
         # Both or neither - ambiguous
         if has_yes and has_no:
-            # Check which comes first
-            yes_pos = text_lower.find("yes")
-            no_pos = text_lower.find("no")
+            # Check which word comes first (as whole words, so "know" or
+            # "snow" don't count as an earlier "no")
             if yes_pos < no_pos:
                 return self._make_result("yes", text, "low", default)
             else:
@@ -6,8 +6,10 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
+from .context import OutputMode
 
-@dataclass
+
+@dataclass(slots=True)
 class InputSpec:
     """Specification for a component input."""
     type: str  # e.g., "string", "list[string]", "any"
@@ -16,24 +18,48 @@ class InputSpec:
     default: Any = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputSpec:
     """Specification for a component output."""
     type: str  # e.g., "string", "boolean", "dict"
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigSpec:
-    """Specification for a component configuration option."""
+    """
+    Specification for a component configuration option.
+
+    choices should be hashable values; they are then checked with a set
+    lookup (unhashable choices fall back to a list scan).
+    """
     type: str  # "string", "integer", "boolean", "float", "list", "dict"
     required: bool = False
     default: Any = None
     description: str = ""
     choices: list[Any] | None = None  # Allowed values
-
-
-@dataclass
+    _choices_set: frozenset[Any] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.choices:
+            try:
+                self._choices_set = frozenset(self.choices)
+            except TypeError:
+                pass
+
+    def allows(self, value: Any) -> bool:
+        """Check a value against choices (any value is allowed without choices)."""
+        if not self.choices:
+            return True
+        if self._choices_set is not None:
+            try:
+                return value in self._choices_set
+            except TypeError:
+                return False  # Unhashable value can't equal a hashable choice
+        return value in self.choices
+
+
+@dataclass(slots=True)
 class ComponentManifest:
     """Self-description of a component's interface."""
     type: str  # e.g., "source/text_list", "transform/openrouter"
@@ -44,7 +70,7 @@ class ComponentManifest:
     category: Literal["source", "transform", "control", "sink"] = "transform"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of validating component inputs/config."""
     valid: bool
@@ -65,6 +91,12 @@ class Component(ABC):
     component via describe() and routes data accordingly.
     """
 
+    # Set on components whose work never awaits: the engine then calls
+    # execute_sync() directly and skips creating a coroutine per call.
+    # Such components must define execute_sync(inputs, context) with the
+    # same signature and result as execute() (which can just delegate to it).
+    is_pure_sync = False
+
     def __init__(self, instance_id: str, config: dict[str, Any]):
         """
         Initialize component with instance ID and configuration.
@@ -76,10 +108,20 @@ class Component(ABC):
         self.instance_id = instance_id
         self.config = config
         self._validate_config()
+        # Spec defaults overlaid with the plan's values, so get_config() is a
+        # single dict lookup
+        self._resolved_config = {
+            name: spec.default for name, spec in self.get_manifest().config.items()
+        }
+        self._resolved_config.update(config)
+        # Input names as sets, so validate() can diff them against the inputs
+        inputs = self.get_manifest().inputs
+        self._required_input_names = frozenset(n for n, s in inputs.items() if s.required)
+        self._known_input_names = frozenset(inputs)
 
     def _validate_config(self) -> None:
         """Validate configuration against manifest."""
-        manifest = self.describe()
+        manifest = self.get_manifest()
         for name, spec in manifest.config.items():
             if spec.required and name not in self.config:
                 if spec.default is None:
@@ -87,19 +129,14 @@ class Component(ABC):
                         f"Component {self.instance_id}: missing required config '{name}'"
                     )
             if name in self.config and spec.choices:
-                if self.config[name] not in spec.choices:
+                if not spec.allows(self.config[name]):
                     raise ValueError(
                         f"Component {self.instance_id}: config '{name}' must be one of {spec.choices}"
                     )
 
     def get_config(self, key: str, default: Any = None) -> Any:
         """Get configuration value with fallback to spec default."""
-        if key in self.config:
-            return self.config[key]
-        manifest = self.describe()
-        if key in manifest.config:
-            return manifest.config[key].default
-        return default
+        return self._resolved_config.get(key, default)
 
     def report(self, message: str, context: "ExecutionContext") -> None:
         """
@@ -109,8 +146,7 @@ class Component(ABC):
         - "✓ Wrote 100 rows to results.csv"
         - "Aggregated: 27 flagged (28%)"
         """
-        from .context import OutputMode
-        if context.output_mode in (OutputMode.NORMAL, OutputMode.DEBUG):
+        if context.output_mode is not OutputMode.QUIET:
             print(message, flush=True)
 
     def debug(self, message: str, context: "ExecutionContext") -> None:
@@ -121,8 +157,7 @@ class Component(ABC):
         - "API response: 'yes' (42ms)"
         - "Resolved {item} → 'anya_forger'"
         """
-        from .context import OutputMode
-        if context.output_mode == OutputMode.DEBUG:
+        if context.output_mode is OutputMode.DEBUG:
             print(f"[DEBUG] {message}", flush=True)
 
     @classmethod
@@ -137,24 +172,43 @@ class Component(ABC):
         """
         pass
 
+    @classmethod
+    def get_manifest(cls) -> ComponentManifest:
+        """
+        Return the manifest from describe(), built once per class.
+
+        describe() constructs a fresh manifest on every call; this caches it
+        on the class itself (not inherited by subclasses). Treat it as read-only.
+        """
+        manifest = cls.__dict__.get("_manifest")
+        if manifest is None:
+            manifest = cls.describe()
+            cls._manifest = manifest
+        return manifest
+
     def validate(self, inputs: dict[str, Any]) -> ValidationResult:
         """
         Validate that provided inputs satisfy requirements.
 
         Override for custom validation logic.
         """
-        manifest = self.describe()
         errors = []
         warnings = []
 
-        for name, spec in manifest.inputs.items():
-            if spec.required and name not in inputs:
-                errors.append(f"Missing required input: {name}")
+        missing = self._required_input_names - inputs.keys()
+        if missing:
+            # Report in manifest order
+            errors = [
+                f"Missing required input: {name}"
+                for name in self.get_manifest().inputs if name in missing
+            ]
 
         # Check for unexpected inputs (warning only)
-        for name in inputs:
-            if name not in manifest.inputs:
-                warnings.append(f"Unexpected input: {name}")
+        if not inputs.keys() <= self._known_input_names:
+            warnings = [
+                f"Unexpected input: {name}"
+                for name in inputs if name not in self._known_input_names
+            ]
 
         return ValidationResult(
             valid=len(errors) == 0,
@@ -180,6 +234,14 @@ class Component(ABC):
         """
         pass
 
+    def close(self) -> None:
+        """
+        Release resources held between calls (e.g. an open output file).
+
+        Called when the engine replaces the component or a run fails
+        before it was finalized. Does nothing by default.
+        """
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(id={self.instance_id!r})"
 
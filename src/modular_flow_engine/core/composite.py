@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import copy
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, TYPE_CHECKING
 
+try:
+    import orjson  # Optional: faster parsing of composite definition files
+except ImportError:
+    orjson = None
+
 from .component import (
     Component,
     ComponentManifest,
@@ -20,6 +27,9 @@ from .registry import ComponentRegistry
 if TYPE_CHECKING:
     from .engine import DataflowEngine
 
+# Thread cap for reading composite files in load_composites_from_directory
+_MAX_LOAD_WORKERS = 8
+
 
 class CompositeComponent(Component):
     """
@@ -59,8 +69,15 @@ class CompositeComponent(Component):
         # Get the definition for this composite type
         # The type is stored during registration
         self._definition = self._get_definition_for_instance(instance_id, config)
+        self._instance_manifest = self._build_instance_manifest()
+        self._required_inputs = tuple(
+            name for name, spec in self._instance_manifest.inputs.items() if spec.required
+        )
         super().__init__(instance_id, config)
 
+        # Internal plan with this instance's config merged in (fixed per instance)
+        self._internal_plan = self._build_internal_plan()
+
         # Internal engine for executing the composite's flow
         self._internal_engine: DataflowEngine | None = None
 
@@ -93,6 +110,10 @@ class CompositeComponent(Component):
 
     def describe_instance(self) -> ComponentManifest:
         """Describe this specific composite instance."""
+        return self._instance_manifest
+
+    def _build_instance_manifest(self) -> ComponentManifest:
+        """Build the manifest for this instance from its definition."""
         defn = self._definition
 
         # Build inputs from definition
@@ -132,14 +153,41 @@ class CompositeComponent(Component):
             config=config,
         )
 
+    def _build_internal_plan(self) -> dict[str, Any]:
+        """Build the internal plan, applying composite config overrides."""
+        internal = self._definition.get("internal", {})
+
+        # Copy so overrides don't leak into the shared definition
+        components = copy.deepcopy(internal.get("components", {}))
+
+        # Allow composite config to override internal component config
+        overrides = {k: v for k, v in self.config.items() if not k.startswith("_")}  # Skip internal keys
+        for comp_def in components.values():
+            comp_config = comp_def.setdefault("config", {})
+            for key in overrides.keys() & comp_config.keys():
+                comp_config[key] = overrides[key]
+
+        return {
+            "name": f"{self.instance_id}_internal",
+            "components": components,
+            "flow": internal.get("flow", []),
+        }
+
+    def _load_internal_engine(self) -> DataflowEngine:
+        """Create an engine with the composite's internal plan loaded."""
+        from .engine import DataflowEngine
+
+        internal_engine = DataflowEngine()
+        internal_engine.load_plan(self._internal_plan)
+        return internal_engine
+
     def validate(self, inputs: dict[str, Any]) -> ValidationResult:
         """Validate inputs against the composite's input spec."""
-        manifest = self.describe_instance()
         errors = []
         warnings = []
 
-        for name, spec in manifest.inputs.items():
-            if spec.required and name not in inputs:
+        for name in self._required_inputs:
+            if name not in inputs:
                 errors.append(f"Missing required input: {name}")
 
         return ValidationResult(valid=len(errors) == 0, errors=errors, warnings=warnings)
@@ -150,45 +198,29 @@ class CompositeComponent(Component):
         context: ExecutionContext
     ) -> dict[str, Any]:
         """Execute the composite's internal flow."""
-        from .engine import DataflowEngine
+        # Reuse the loaded internal engine between calls. If it is busy (the
+        # composite is running concurrently), load a fresh one for this call.
+        internal_engine = self._internal_engine
+        self._internal_engine = None
+        if internal_engine is None:
+            internal_engine = self._load_internal_engine()
 
-        defn = self._definition
-        internal = defn.get("internal", {})
-
-        # Create internal engine
-        internal_engine = DataflowEngine()
-
-        # Build internal plan
-        internal_plan = {
-            "name": f"{self.instance_id}_internal",
-            "components": internal.get("components", {}),
-            "flow": internal.get("flow", []),
-        }
-
-        # Merge composite config into component configs
-        for comp_id, comp_def in internal_plan["components"].items():
-            if "config" not in comp_def:
-                comp_def["config"] = {}
-            # Allow composite config to override internal component config
-            for key, value in self.config.items():
-                if not key.startswith("_"):  # Skip internal keys
-                    if key in comp_def.get("config", {}):
-                        comp_def["config"][key] = value
-
-        internal_engine.load_plan(internal_plan)
-
-        # Pass inputs as plan inputs (they'll be available as initial context variables)
-        internal_engine.set_inputs(inputs)
+        try:
+            # Pass inputs as plan inputs (they'll be available as initial context variables)
+            internal_engine.reset_state()
+            internal_engine.set_inputs(inputs)
 
-        # Execute internal flow
-        result = await internal_engine.execute()
+            # Execute internal flow
+            result = await internal_engine.execute()
+        finally:
+            self._internal_engine = internal_engine
 
         if not result.success:
             error_msgs = [e.message for e in result.errors if not e.recovered]
             raise RuntimeError(f"Composite execution failed: {error_msgs}")
 
         # Map internal outputs to composite outputs
-        output_mappings = internal.get("output_mappings", {})
+        output_mappings = self._definition.get("internal", {}).get("output_mappings", {})
         outputs = {}
 
         for output_name, mapping in output_mappings.items():
@@ -198,6 +230,11 @@ class CompositeComponent(Component):
 
         return outputs
 
+    def close(self) -> None:
+        """Close the components of the internal engine."""
+        if self._internal_engine is not None:
+            self._internal_engine._close_components()
+
 
 def load_composite(path: Path | str) -> str:
     """
@@ -206,9 +243,19 @@ def load_composite(path: Path | str) -> str:
     Returns the composite name for reference.
     """
     path = Path(path)
+    return _register_definition(_read_definition(path), path)
+
+
+def _read_definition(path: Path) -> dict:
+    """Read and parse a composite definition file."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with open(path, "r") as f:
-        definition = json.load(f)
+        return json.load(f)
+
 
+def _register_definition(definition: dict, path: Path) -> str:
+    """Register a parsed composite definition, returning its name."""
     name = definition.get("name")
     if not name:
         raise ValueError(f"Composite definition missing 'name': {path}")
@@ -283,9 +330,19 @@ def load_composites_from_directory(directory: Path | str) -> list[str]:
     directory = Path(directory)
     loaded = []
 
-    for path in directory.glob("*.json"):
+    paths = list(directory.glob("*.json"))
+    if not paths:
+        return loaded
+
+    # Read and parse files concurrently; the registries are only touched
+    # from this thread, in directory order
+    with ThreadPoolExecutor(max_workers=min(len(paths), _MAX_LOAD_WORKERS)) as pool:
+        futures = [pool.submit(_read_definition, path) for path in paths]
+
+    for path, future in zip(paths, futures):
         try:
-            name = load_and_register_composite(path)
+            name = _register_definition(future.result(), path)
+            register_composite(name)
             loaded.append(name)
         except Exception as e:
             print(f"Warning: Failed to load composite {path}: {e}")
@@ -2,15 +2,130 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 from enum import Enum
 from pathlib import Path
-from typing import Any, TYPE_CHECKING
+from collections.abc import Callable
+from typing import IO, Any, TYPE_CHECKING
+
+try:
+    import orjson  # Optional: much faster JSON encoding for file output
+except ImportError:
+    orjson = None
 
 if TYPE_CHECKING:
     from .engine import DataflowEngine
 
+# Large write buffer for file destinations (fewer write(2) calls on big payloads)
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+# Directories already created by this process (skip repeated mkdir/stat calls)
+_ensured_dirs: set[Path] = set()
+
+
+def ensure_dir(path: Path) -> None:
+    """Create a directory (and parents) once per process."""
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+
+
+def open_output(path: Path, mode: str = "wb", **kwargs: Any) -> IO:
+    """Open a file for writing, creating its directory if needed."""
+    ensure_dir(path.parent)
+    try:
+        return open(path, mode, **kwargs)
+    except FileNotFoundError:
+        # Directory was removed since it was created (e.g. between runs)
+        _ensured_dirs.discard(path.parent)
+        ensure_dir(path.parent)
+        return open(path, mode, **kwargs)
+
+
+def write_bytes(path: Path, payload: bytes) -> None:
+    """Write an encoded payload to path, creating its directory if needed."""
+    with open_output(path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(payload)
+
+
+def encode_json(data: Any) -> bytes:
+    """
+    Encode data as indented UTF-8 JSON (orjson when installed).
+
+    orjson writes NaN/Infinity as null and some floats in shorter form
+    (1e20 rather than 1e+20). Data it cannot encode at all, such as
+    integers beyond 64 bits, falls back to the json module.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False, default=str).encode("utf-8")
+
+
+# {var} placeholders in values resolved against a context
+_PLACEHOLDER_RE = re.compile(r"\{([^}]+)\}")
+
+
+def compile_resolver(value: Any) -> Callable[[ExecutionContext], Any]:
+    """
+    Compile a value into a function that resolves it against a context.
+
+    The result of compiled(context) is the same as context.resolve(value),
+    but placeholders are parsed once here instead of on every call.
+    """
+    if isinstance(value, str):
+        return _compile_string(value)
+    elif isinstance(value, list):
+        item_resolvers = [compile_resolver(item) for item in value]
+        return lambda context: [resolve(context) for resolve in item_resolvers]
+    elif isinstance(value, dict):
+        value_resolvers = [(k, compile_resolver(v)) for k, v in value.items()]
+        return lambda context: {k: resolve(context) for k, resolve in value_resolvers}
+    return lambda context: value
+
+
+def _compile_string(template: str) -> Callable[[ExecutionContext], Any]:
+    """Compile a string template (see ExecutionContext._resolve_string)."""
+    # Entire string is a single placeholder - resolves to the raw value
+    match = _PLACEHOLDER_RE.fullmatch(template)
+    if match:
+        var_name = match.group(1)
+
+        def resolve_var(context: ExecutionContext) -> Any:
+            result = context.get(var_name)
+            # If not found, return template as-is (might be literal)
+            return result if result is not None else template
+        return resolve_var
+
+    # (text, var_name) segments; var_name is None for literal text
+    segments: list[tuple[str, str | None]] = []
+    pos = 0
+    for m in _PLACEHOLDER_RE.finditer(template):
+        if m.start() > pos:
+            segments.append((template[pos:m.start()], None))
+        segments.append((m.group(0), m.group(1)))
+        pos = m.end()
+    if not segments:
+        return lambda context: template
+    if pos < len(template):
+        segments.append((template[pos:], None))
+
+    def interpolate(context: ExecutionContext) -> str:
+        parts = []
+        for text, var_name in segments:
+            if var_name is None:
+                parts.append(text)
+            else:
+                val = context.get(var_name)
+                parts.append(str(val) if val is not None else text)
+        return "".join(parts)
+    return interpolate
+
 
 class OutputMode(Enum):
     """Controls what components print to console."""
@@ -50,6 +165,7 @@ class ExecutionContext:
         self._warned_sinks: set[str] = set()  # Avoid repeated warnings
         self._sink_ids: set[str] = set()  # Track which components are sinks
         self._returns: dict[str, Any] = {}  # Return destination accumulator
+        self._queued_writes: list[tuple[Path, bytes]] = []  # Deferred file writes
 
     @property
     def engine(self) -> "DataflowEngine | None":
@@ -308,7 +424,7 @@ class ExecutionContext:
         Otherwise, perform string interpolation.
         """
         # Check if entire string is a single placeholder
-        match = re.fullmatch(r"\{([^}]+)\}", template)
+        match = _PLACEHOLDER_RE.fullmatch(template)
         if match:
             var_name = match.group(1)
             result = self.get(var_name)
@@ -323,7 +439,7 @@ class ExecutionContext:
             val = self.get(var_name)
             return str(val) if val is not None else m.group(0)
 
-        return re.sub(r"\{([^}]+)\}", replace, template)
+        return _PLACEHOLDER_RE.sub(replace, template)
 
     def resolve_inputs(self, inputs_spec: dict[str, Any]) -> dict[str, Any]:
         """Resolve all input specifications to actual values."""
@@ -373,6 +489,43 @@ class ExecutionContext:
         else:
             raise ValueError(f"Unknown destination: {to!r}")
 
+    def write_multi(
+        self,
+        data: dict[str, Any],
+        destinations: list[str],
+        *,
+        path: str | None = None,
+        return_key: str | None = None,
+    ) -> None:
+        """
+        Write the same data to several destinations in one submission.
+
+        Args:
+            data: Data to write (must be JSON-serializable dict)
+            destinations: Any of "return", "file", "console"
+            path: Required if "file" is among the destinations
+            return_key: Nest data under this key for the "return" destination
+
+        All destinations are checked before anything is written, and the
+        JSON encoding is shared between the file and console destinations.
+        """
+        for to in destinations:
+            if to not in ("return", "file", "console"):
+                raise ValueError(f"Unknown destination: {to!r}")
+        if "file" in destinations and not path:
+            raise ValueError("File destination requires 'path' argument")
+
+        payload: bytes | None = None
+        for to in destinations:
+            if to == "return":
+                self._write_return({return_key: data} if return_key else data)
+            elif to == "file":
+                payload = payload or encode_json(data)
+                self._write_file(data, path, payload)
+            elif self.output_mode in (OutputMode.NORMAL, OutputMode.DEBUG):
+                payload = payload or encode_json(data)
+                print(payload.decode("utf-8"))
+
     def _write_return(self, data: dict[str, Any]) -> None:
         """Write data to the return accumulator (propagates to root)."""
         # Propagate to root context so returns are globally accessible
@@ -381,24 +534,47 @@ class ExecutionContext:
         else:
             self._returns.update(data)
 
-    def _write_file(self, data: dict[str, Any], path: str) -> None:
-        """Write data to a JSON file."""
+    def _write_file(self, data: dict[str, Any], path: str, payload: bytes | None = None) -> None:
+        """Write data to a JSON file (payload: pre-encoded data, if available)."""
         full_path = Path(path)
 
         # Resolve relative paths against output_dir
         if self.output_dir and not full_path.is_absolute():
             full_path = self.output_dir / full_path
 
-        # Ensure parent directory exists
-        full_path.parent.mkdir(parents=True, exist_ok=True)
+        if payload is None:
+            payload = encode_json(data)
+
+        if self.get_setting("defer_writes", False):
+            self.queue_write(full_path, payload)
+        else:
+            write_bytes(full_path, payload)
+
+    def queue_write(self, path: Path, payload: bytes) -> None:
+        """
+        Queue a file write until the flow finishes (propagates to root).
+
+        Used when the plan sets "defer_writes": the engine flushes every
+        queued file together via flush_writes() once the flow completes.
+        """
+        if self._parent is not None:
+            self._parent.queue_write(path, payload)
+        else:
+            self._queued_writes.append((path, payload))
 
-        with open(full_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+    async def flush_writes(self) -> None:
+        """Write all queued files concurrently in worker threads."""
+        queued, self._queued_writes = self._queued_writes, []
+        if queued:
+            await asyncio.gather(*(
+                asyncio.to_thread(write_bytes, path, payload)
+                for path, payload in queued
+            ))
 
     def _write_console(self, data: dict[str, Any]) -> None:
         """Write data to console (respects output_mode)."""
         if self.output_mode in (OutputMode.NORMAL, OutputMode.DEBUG):
-            print(json.dumps(data, indent=2, ensure_ascii=False, default=str))
+            print(encode_json(data).decode("utf-8"))
 
     def get_returns(self) -> dict[str, Any]:
         """Get accumulated return data from all sinks."""
@@ -3,14 +3,23 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
+import re
+import sys
 import time
+from collections.abc import Awaitable, Callable, Sized
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson  # Optional: faster parsing of plan files
+except ImportError:
+    orjson = None
+
 from .component import Component
-from .context import ExecutionContext, OutputMode
+from .context import ExecutionContext, OutputMode, compile_resolver
 from .errors import (
     ValidationError,
     ExecutionError,
@@ -22,6 +31,64 @@ from .errors import (
 from .registry import ComponentRegistry
 from .tracing import ExecutionTracer, TraceLevel, ExecutionTrace
 
+# {$inputs.name} references in component config
+_INPUT_REF_RE = re.compile(r"\{\$inputs\.([^}]+)\}")
+
+# Strings that count as false in conditionals (compared lowercased)
+_FALSY_STRINGS = frozenset({"false", "no", "0", ""})
+
+# Marks an input with no value and no schema default
+_MISSING = object()
+
+# Step keys that name a component, with the word used in validation errors
+_STEP_REF_KEYS = (("call", "component"), ("source", "source"), ("sink", "sink"))
+
+# A flow step bound to the engine method that runs it: handler(context, errors)
+_StepHandler = Callable[[ExecutionContext, list[ErrorRecord]], Awaitable[None]]
+
+
+def _writes_scope(steps: list[dict]) -> bool:
+    """Check whether any step (including nested blocks) maps outputs to variables."""
+    for step in steps:
+        if step.get("outputs"):
+            return True
+        if "loop" in step and _writes_scope(step["loop"].get("steps", [])):
+            return True
+        if "parallel" in step and _writes_scope(step["parallel"]):
+            return True
+        if "conditional" in step:
+            cond_config = step["conditional"]
+            if _writes_scope(cond_config.get("then", [])) or _writes_scope(cond_config.get("else", [])):
+                return True
+    return False
+
+
+def _loads_plan(data: bytes | str) -> Any:
+    """
+    Parse plan JSON with orjson, or return None to defer to the json module.
+
+    orjson rejects NaN/Infinity literals and non-UTF-8 bytes, both of which
+    json accepts for plans (files are then read in the locale encoding).
+    """
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return None
+
+
+def _find_input_refs(value: Any) -> set[str]:
+    """Collect the input names referenced by {$inputs.X} anywhere in a config value."""
+    if isinstance(value, str):
+        return set(_INPUT_REF_RE.findall(value))
+    refs = set()
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, list):
+        return refs
+    for item in value:
+        refs |= _find_input_refs(item)
+    return refs
+
 
 @dataclass
 class PlanInputSpec:
@@ -70,6 +137,11 @@ class DataflowEngine:
             "errors_recovered": 0,
         }
         self._plan_inputs: dict[str, Any] = {}  # User-provided input values
+        self._input_schema: dict[str, PlanInputSpec] | None = None  # Built from plan on first use
+        self._input_refs: dict[str, set[str]] = {}  # Input name -> ids of components using it
+        self._resolved_configs: dict[str, dict[str, Any]] = {}  # Component id -> config with inputs resolved
+        self._compiled_flow: list[tuple[dict, _StepHandler]] = []  # Built by load_plan
+        self._sink_ids: list[str] = []  # Sink components, registered with each run's context
 
     def load_plan(self, plan: dict[str, Any] | str | Path) -> None:
         """
@@ -78,13 +150,20 @@ class DataflowEngine:
         if isinstance(plan, (str, Path)):
             path = Path(plan)
             if path.exists():
-                with open(path, "r") as f:
-                    plan = json.load(f)
+                plan = _loads_plan(path.read_bytes()) if orjson is not None else None
+                if plan is None:
+                    with open(path, "r") as f:
+                        plan = json.load(f)
             else:
-                plan = json.loads(str(plan))
+                text = str(plan)
+                plan = _loads_plan(text) if orjson is not None else None
+                if plan is None:
+                    plan = json.loads(text)
 
         self.plan = plan
+        self._input_schema = None
         self._instantiate_components()
+        self._compiled_flow = self._compile_steps(plan.get("flow", []))
 
         # Set error handling from plan
         if "error_handling" in plan:
@@ -100,7 +179,10 @@ class DataflowEngine:
         self.load_plan(flow)
 
     def get_input_schema(self) -> dict[str, PlanInputSpec]:
-        """Get the plan's declared inputs with their specifications."""
+        """Get the plan's declared inputs with their specifications (cached per plan)."""
+        if self._input_schema is not None:
+            return self._input_schema
+
         schema = {}
         for name, spec in self.plan.get("inputs", {}).items():
             if isinstance(spec, dict):
@@ -113,14 +195,42 @@ class DataflowEngine:
             else:
                 # Simple string type shorthand: "inputs": {"name": "string"}
                 schema[name] = PlanInputSpec(type=spec, required=True)
+        self._input_schema = schema
         return schema
 
     def set_inputs(self, inputs: dict[str, Any]) -> None:
         """Set plan input values. Call before execute()."""
-        self._plan_inputs.update(inputs)
-        # Re-instantiate components with new input values
+        plan_inputs = self._plan_inputs
+        changed = [
+            name for name, value in inputs.items()
+            if name not in plan_inputs or plan_inputs[name] is not value and plan_inputs[name] != value
+        ]
+        plan_inputs.update(inputs)
+
+        # Recreate every component so stateful ones (collectors, writers) start
+        # fresh, but only re-resolve config for those referencing a changed input
         if self.plan:
-            self._instantiate_components()
+            affected = set()
+            for name in changed:
+                affected.update(self._input_refs.get(name, ()))
+            self._close_components()
+            create = self.registry.create
+            resolved_configs = self._resolved_configs
+            for instance_id, comp_def in self.plan.get("components", {}).items():
+                if instance_id in affected or instance_id not in resolved_configs:
+                    self.components[instance_id] = self._create_component(instance_id, comp_def)
+                else:
+                    self.components[instance_id] = create(
+                        comp_def["type"], instance_id, resolved_configs[instance_id]
+                    )
+
+    def reset_state(self) -> None:
+        """Forget previously set plan inputs so the engine can run again fresh."""
+        self._plan_inputs.clear()
+        # Configs resolved against the old inputs are stale now
+        for instance_ids in self._input_refs.values():
+            for instance_id in instance_ids:
+                self._resolved_configs.pop(instance_id, None)
 
     def get_missing_inputs(self) -> list[tuple[str, PlanInputSpec]]:
         """Get list of required inputs that haven't been provided."""
@@ -133,32 +243,31 @@ class DataflowEngine:
 
     def _resolve_input_references(self, value: Any) -> Any:
         """Resolve {$inputs.X} references in a value."""
-        import re
-
         if isinstance(value, str):
-            # Check for full replacement: "{$inputs.name}"
-            match = re.fullmatch(r"\{\$inputs\.([^}]+)\}", value)
-            if match:
-                input_name = match.group(1)
-                if input_name in self._plan_inputs:
-                    return self._plan_inputs[input_name]
-                # Check for default in schema
-                schema = self.get_input_schema()
-                if input_name in schema and schema[input_name].default is not None:
-                    return schema[input_name].default
-                return value  # Leave unresolved for validation to catch
+            # Most config strings are plain literals - skip the regex for them
+            if "{$inputs." not in value:
+                return value
 
-            # Partial replacement: "prefix_{$inputs.name}_suffix"
-            def replace_input(m: re.Match) -> str:
-                input_name = m.group(1)
-                if input_name in self._plan_inputs:
-                    return str(self._plan_inputs[input_name])
-                schema = self.get_input_schema()
-                if input_name in schema and schema[input_name].default is not None:
-                    return str(schema[input_name].default)
-                return m.group(0)  # Leave unresolved
+            # One scan finds every reference
+            matches = list(_INPUT_REF_RE.finditer(value))
 
-            return re.sub(r"\{\$inputs\.([^}]+)\}", replace_input, value)
+            # Full replacement: "{$inputs.name}" keeps the input's type
+            if len(matches) == 1 and matches[0].span() == (0, len(value)):
+                resolved = self._lookup_input(matches[0].group(1))
+                if resolved is _MISSING:
+                    return value  # Leave unresolved for validation to catch
+                return resolved
+
+            # Partial replacement: "prefix_{$inputs.name}_suffix"
+            parts = []
+            pos = 0
+            for m in matches:
+                parts.append(value[pos:m.start()])
+                resolved = self._lookup_input(m.group(1))
+                parts.append(m.group(0) if resolved is _MISSING else str(resolved))  # Leave unresolved
+                pos = m.end()
+            parts.append(value[pos:])
+            return "".join(parts)
 
         elif isinstance(value, dict):
             return {k: self._resolve_input_references(v) for k, v in value.items()}
@@ -167,80 +276,114 @@ class DataflowEngine:
 
         return value
 
+    def _lookup_input(self, input_name: str) -> Any:
+        """Get an input's value, falling back to its schema default, else _MISSING."""
+        if input_name in self._plan_inputs:
+            return self._plan_inputs[input_name]
+        schema = self.get_input_schema()
+        if input_name in schema and schema[input_name].default is not None:
+            return schema[input_name].default
+        return _MISSING
+
     def _instantiate_components(self) -> None:
         """Create component instances from plan definitions."""
+        self._close_components()
         self.components.clear()
+        self._input_refs = {}
+        self._resolved_configs = {}
+        self._sink_ids = []
 
         components_def = self.plan.get("components", {})
         for instance_id, comp_def in components_def.items():
-            comp_type = comp_def.get("type")
-            if not comp_type:
-                raise ValidationError(
-                    f"Component '{instance_id}' missing 'type'",
-                    errors=[f"Component '{instance_id}' has no type specified"]
-                )
+            self.components[instance_id] = self._create_component(instance_id, comp_def)
+            if comp_def["type"].startswith("sink/"):
+                self._sink_ids.append(instance_id)
 
-            # Resolve {$inputs.X} references in config
-            config = comp_def.get("config", {})
-            resolved_config = self._resolve_input_references(config)
+            # Remember which inputs this component's config depends on
+            for name in _find_input_refs(comp_def.get("config", {})):
+                self._input_refs.setdefault(name, set()).add(instance_id)
 
-            component = self.registry.create(comp_type, instance_id, resolved_config)
-            self.components[instance_id] = component
+    def _close_components(self) -> None:
+        """Let the current components release held resources before they are dropped."""
+        for instance_id, component in self.components.items():
+            try:
+                component.close()
+            except Exception as e:
+                print(f"[Warning] Failed to close '{instance_id}': {e}")
+
+    def _create_component(self, instance_id: str, comp_def: dict[str, Any]) -> Component:
+        """Create one component instance from its plan definition."""
+        comp_type = comp_def.get("type")
+        if not comp_type:
+            raise ValidationError(
+                f"Component '{instance_id}' missing 'type'",
+                errors=[f"Component '{instance_id}' has no type specified"]
+            )
+
+        # Resolve {$inputs.X} references in config
+        config = comp_def.get("config", {})
+        resolved_config = self._resolve_input_references(config)
+        self._resolved_configs[instance_id] = resolved_config
+
+        return self.registry.create(comp_type, instance_id, resolved_config)
 
-    def validate(self) -> list[str]:
+    def validate(self, fail_fast: bool = False) -> list[str]:
         """
         Validate the plan before execution.
 
+        Args:
+            fail_fast: Stop at the first error instead of collecting all of them.
+
         Returns list of error messages (empty if valid).
         """
         errors = []
+        registry_get = self.registry.get
+        components = self.components
 
         # Check all component types exist
         for instance_id, comp_def in self.plan.get("components", {}).items():
             comp_type = comp_def.get("type")
-            if not self.registry.get(comp_type):
+            if not registry_get(comp_type):
                 errors.append(f"Unknown component type: {comp_type}")
-
-        # Check flow references valid components
-        def check_flow(steps: list, path: str = "flow"):
-            for i, step in enumerate(steps):
-                step_path = f"{path}[{i}]"
-
-                if "call" in step:
-                    comp_id = step["call"]
-                    if comp_id not in self.components:
-                        errors.append(
-                            f"{step_path}: references unknown component '{comp_id}'"
-                        )
-
-                if "source" in step:
-                    src_id = step["source"]
-                    if src_id not in self.components:
-                        errors.append(
-                            f"{step_path}: references unknown source '{src_id}'"
-                        )
-
-                if "sink" in step:
-                    sink_id = step["sink"]
-                    if sink_id not in self.components:
-                        errors.append(
-                            f"{step_path}: references unknown sink '{sink_id}'"
-                        )
-
-                # Recurse into control structures
-                if "loop" in step:
-                    inner_steps = step["loop"].get("steps", [])
-                    check_flow(inner_steps, f"{step_path}.loop.steps")
-
-                if "conditional" in step:
-                    for branch in ["then", "else"]:
-                        if branch in step["conditional"]:
-                            check_flow(
-                                step["conditional"][branch],
-                                f"{step_path}.conditional.{branch}"
-                            )
-
-        check_flow(self.plan.get("flow", []))
+                if fail_fast:
+                    return errors
+
+        # Check flow references valid components. Walks nested blocks with an
+        # explicit stack of step iterators, in the same order as a recursive walk.
+        stack = [(enumerate(self.plan.get("flow", [])), "flow")]
+        while stack:
+            steps, path = stack[-1]
+            entry = next(steps, None)
+            if entry is None:
+                stack.pop()
+                continue
+            i, step = entry
+            step_path = f"{path}[{i}]"
+
+            for key, kind in _STEP_REF_KEYS:
+                if key in step and step[key] not in components:
+                    errors.append(f"{step_path}: references unknown {kind} '{step[key]}'")
+                    if fail_fast:
+                        return errors
+
+            # Queue control-structure bodies; the last pushed is walked first
+            if "conditional" in step:
+                conditional = step["conditional"]
+                for branch in ("else", "then"):
+                    if branch in conditional:
+                        stack.append((
+                            enumerate(conditional[branch]),
+                            f"{step_path}.conditional.{branch}",
+                        ))
+
+            if "loop" in step:
+                stack.append((
+                    enumerate(step["loop"].get("steps", [])),
+                    f"{step_path}.loop.steps",
+                ))
+
+            if "parallel" in step:
+                stack.append((enumerate(step["parallel"]), f"{step_path}.parallel"))
 
         return errors
 
@@ -284,10 +427,8 @@ class DataflowEngine:
         )
 
         # Register sink components for finalization tracking
-        for instance_id, comp_def in self.plan.get("components", {}).items():
-            comp_type = comp_def.get("type", "")
-            if comp_type.startswith("sink/"):
-                self.context.register_sink(instance_id)
+        for instance_id in self._sink_ids:
+            self.context.register_sink(instance_id)
         self.tracer = ExecutionTracer(level=self.tracer.level)  # Reset tracer
         self._stats = {
             "components_executed": 0,
@@ -299,8 +440,10 @@ class DataflowEngine:
 
         try:
             # Execute flow
-            flow = self.plan.get("flow", [])
-            await self._execute_steps(flow, self.context, errors)
+            await self._execute_steps(self._compiled_flow, self.context, errors)
+
+            # Write out any files sinks deferred (settings.defer_writes)
+            await self.context.flush_writes()
 
             # Get returns from context (accumulated by sinks via context.write())
             returns = self.context.get_returns()
@@ -321,6 +464,15 @@ class DataflowEngine:
             if error_traces:
                 print(self.tracer.format_error_context(error_traces[-1]))
 
+            # Still write what sinks finalized before the failure
+            try:
+                await self.context.flush_writes()
+            except Exception as flush_error:
+                print(f"[Warning] Failed to write deferred files: {flush_error}")
+
+            # Finish files that unfinalized sinks were streaming
+            await asyncio.to_thread(self._close_components)
+
             errors.append(ErrorRecord(
                 error_type=type(e).__name__,
                 message=str(e),
@@ -337,76 +489,149 @@ class DataflowEngine:
 
     async def _execute_steps(
         self,
-        steps: list[dict],
+        steps: list[tuple[dict, _StepHandler]],
         context: ExecutionContext,
         errors: list[ErrorRecord],
     ) -> None:
-        """Execute a list of flow steps."""
-        for i, step in enumerate(steps):
-            self._stats["steps_executed"] += 1
+        """Execute a list of compiled flow steps."""
+        # Bound once - this runs for every iteration of every loop
+        stats = self._stats
+        on_error = self.error_protocol.on_error
+
+        for i, (step, handler) in enumerate(steps):
+            stats["steps_executed"] += 1
 
             try:
-                await self._execute_step(step, context, errors)
+                await handler(context, errors)
             except Exception as e:
-                error_record = ErrorRecord(
-                    error_type=type(e).__name__,
-                    message=str(e),
-                    step_index=i,
-                    context={"step": step},
-                )
+                self._handle_step_error(e, i, step, errors, on_error)
 
-                # Check error protocol
-                if self.error_protocol.on_error == "stop":
-                    errors.append(error_record)
-                    raise ExecutionError(
-                        f"Step {i} failed: {e}",
-                        step=step,
-                        cause=e
-                    )
-                elif self.error_protocol.on_error == "skip":
-                    error_record.recovered = True
-                    error_record.recovery_action = "skipped"
-                    errors.append(error_record)
-                    self._stats["errors_recovered"] += 1
-
-    async def _execute_step(
+    def _handle_step_error(
         self,
+        e: Exception,
+        i: int,
         step: dict,
-        context: ExecutionContext,
         errors: list[ErrorRecord],
+        on_error: str,
     ) -> None:
-        """Execute a single flow step."""
+        """Record a failed step, raising if the error protocol says to stop."""
+        error_record = ErrorRecord(
+            error_type=type(e).__name__,
+            message=str(e),
+            step_index=i,
+            context={"step": step},
+        )
+
+        # Check error protocol
+        if on_error == "stop":
+            errors.append(error_record)
+            raise ExecutionError(
+                f"Step {i} failed: {e}",
+                step=step,
+                cause=e
+            )
+        elif on_error == "skip":
+            error_record.recovered = True
+            error_record.recovery_action = "skipped"
+            errors.append(error_record)
+            self._stats["errors_recovered"] += 1
+
+    def _compile_steps(self, steps: list[dict]) -> list[tuple[dict, _StepHandler]]:
+        """Pair each flow step with its handler (see _compile_step)."""
+        return [(step, self._compile_step(step)) for step in steps]
+
+    def _compile_step(self, step: dict) -> _StepHandler:
+        """
+        Choose the handler for a single flow step, once at plan load.
+
+        Loop and conditional bodies are compiled recursively, so running a
+        step never re-inspects its dict to work out what kind of step it is.
+        """
 
         # Source step - load data from source component
         if "source" in step:
-            await self._execute_source(step, context)
+            return functools.partial(self._execute_source, step)
 
         # Call step - execute a transform component
         elif "call" in step:
-            await self._execute_call(step, context)
+            resolve_inputs = compile_resolver(step.get("inputs", {}))
+            return functools.partial(self._execute_call, step, resolve_inputs)
 
         # Sink step - send data to sink component
         elif "sink" in step:
-            await self._execute_sink(step, context)
+            resolve_inputs = compile_resolver(step.get("inputs", {}))
+            return functools.partial(self._execute_sink, step, resolve_inputs)
 
         # Loop step - iterate over a collection
         elif "loop" in step:
-            await self._execute_loop(step, context, errors)
+            inner_steps = step["loop"].get("steps", [])
+            body = self._compile_steps(inner_steps)
+            return functools.partial(
+                self._execute_loop, step, body, _writes_scope(inner_steps)
+            )
 
         # Conditional step
         elif "conditional" in step:
-            await self._execute_conditional(step, context, errors)
+            cond_config = step["conditional"]
+            return functools.partial(
+                self._execute_conditional,
+                step,
+                self._compile_steps(cond_config.get("then", [])),
+                self._compile_steps(cond_config.get("else", [])),
+            )
 
-        else:
-            raise ExecutionError(
-                f"Unknown step type: {list(step.keys())}",
-                step=step
+        # Parallel step - run independent steps concurrently
+        elif "parallel" in step:
+            return functools.partial(
+                self._execute_parallel, step, self._compile_steps(step["parallel"])
             )
 
+        # Unknown step types fail when run, under the plan's error protocol
+        return functools.partial(self._execute_unknown, step)
+
+    async def _execute_parallel(
+        self,
+        step: dict,
+        branches: list[tuple[dict, _StepHandler]],
+        context: ExecutionContext,
+        errors: list[ErrorRecord],
+    ) -> None:
+        """
+        Execute the steps of a parallel block concurrently.
+
+        Every step runs to completion before errors are handled, in step
+        order, under the plan's error protocol (as for sequential steps).
+        """
+        results = await asyncio.gather(
+            *(handler(context, errors) for _, handler in branches),
+            return_exceptions=True,
+        )
+
+        on_error = self.error_protocol.on_error
+        for i, ((branch, _), result) in enumerate(zip(branches, results)):
+            self._stats["steps_executed"] += 1
+            if isinstance(result, Exception):
+                self._handle_step_error(result, i, branch, errors, on_error)
+            elif isinstance(result, BaseException):
+                raise result  # Cancellation etc. is not a step failure
+
+    async def _execute_unknown(
+        self,
+        step: dict,
+        context: ExecutionContext,
+        errors: list[ErrorRecord],
+    ) -> None:
+        """Fail a step with no recognized step type."""
+        raise ExecutionError(
+            f"Unknown step type: {list(step.keys())}",
+            step=step
+        )
+
     async def _execute_source(
         self,
         step: dict,
-        context: ExecutionContext
+        context: ExecutionContext,
+        errors: list[ErrorRecord],
     ) -> None:
         """Execute a source component."""
         source_id = step["source"]
@@ -428,15 +653,16 @@ class DataflowEngine:
     async def _execute_call(
         self,
         step: dict,
-        context: ExecutionContext
+        resolve_inputs: Callable[[ExecutionContext], dict[str, Any]],
+        context: ExecutionContext,
+        errors: list[ErrorRecord],
     ) -> None:
         """Execute a transform component call."""
         comp_id = step["call"]
         component = self.components[comp_id]
 
-        # Resolve inputs from step spec
-        inputs_spec = step.get("inputs", {})
-        inputs = context.resolve_inputs(inputs_spec)
+        # Resolve inputs from step spec (compiled at plan load)
+        inputs = resolve_inputs(context)
 
         # Start tracing
         trace = self.tracer.start_step("call", comp_id, inputs)
@@ -451,8 +677,11 @@ class DataflowEngine:
                     inputs=inputs
                 )
 
-            # Execute
-            outputs = await component.execute(inputs, context)
+            # Execute (compute-only components skip the coroutine round trip)
+            if component.is_pure_sync:
+                outputs = component.execute_sync(inputs, context)
+            else:
+                outputs = await component.execute(inputs, context)
 
             # Map outputs to context variables (in current scope for local use)
             outputs_mapping = step.get("outputs", {})
@@ -487,15 +716,16 @@ class DataflowEngine:
     async def _execute_sink(
         self,
         step: dict,
-        context: ExecutionContext
+        resolve_inputs: Callable[[ExecutionContext], dict[str, Any]],
+        context: ExecutionContext,
+        errors: list[ErrorRecord],
     ) -> None:
         """Execute a sink component (finalization step)."""
         sink_id = step["sink"]
         component = self.components[sink_id]
 
         # Sinks may have inputs to collect
-        inputs_spec = step.get("inputs", {})
-        inputs = context.resolve_inputs(inputs_spec)
+        inputs = resolve_inputs(context)
 
         try:
             outputs = await component.execute(inputs, context)
@@ -515,6 +745,8 @@ class DataflowEngine:
     async def _execute_loop(
         self,
         step: dict,
+        body: list[tuple[dict, _StepHandler]],
+        body_writes_scope: bool,
         context: ExecutionContext,
         errors: list[ErrorRecord],
     ) -> None:
@@ -531,48 +763,62 @@ class DataflowEngine:
                 step=step
             )
 
-        if not hasattr(collection, "__iter__"):
+        try:
+            iterator = iter(collection)
+        except TypeError:
             raise ExecutionError(
                 f"Loop 'over' reference '{over_ref}' is not iterable",
                 step=step
-            )
+            ) from None
 
         loop_var = loop_config.get("as", "item")
         index_var = loop_config.get("index")
-        inner_steps = loop_config.get("steps", [])
 
-        # Get collection size for progress reporting
-        try:
-            total = len(collection)
-        except TypeError:
-            total = None
+        # Get collection size for progress reporting (generators have none)
+        total = len(collection) if isinstance(collection, Sized) else None
 
         # Determine progress interval (show every 10% or every 10 items, whichever is larger)
         show_progress = context.output_mode != OutputMode.QUIET and total and total > 10
         progress_interval = max(total // 10, 10) if show_progress else 0
+        if show_progress:
+            # Only the count and percentage change per tick
+            progress_line = f"  [{loop_var}] {{}}/{total} ({{:.0f}}%)\n".format
+            write = sys.stdout.write
+
+        # A body that maps no outputs only reads its scope, so one child
+        # context can be rebound each iteration instead of creating new ones
+        shared_context = None if body_writes_scope else context.child()
 
-        for i, item in enumerate(collection):
+        set_loop_context = self.tracer.set_loop_context
+        execute_steps = self._execute_steps
+
+        for i, item in enumerate(iterator):
             # Create child context for loop iteration
             loop_vars = {loop_var: item}
             if index_var:
                 loop_vars[index_var] = i
 
-            child_context = context.child(loop_vars)
+            if shared_context is None:
+                child_context = context.child(loop_vars)
+            else:
+                child_context = shared_context
+                child_context.set(loop_var, item)
+                if index_var:
+                    child_context.set(index_var, i)
 
             # Set loop context for tracing (helps debug which iteration failed)
-            self.tracer.set_loop_context(loop_vars)
+            set_loop_context(loop_vars)
 
             # Execute inner steps
-            await self._execute_steps(inner_steps, child_context, errors)
+            await execute_steps(body, child_context, errors)
 
             # Progress output (every N iterations)
             if show_progress and (i + 1) % progress_interval == 0:
-                pct = ((i + 1) / total) * 100
-                print(f"  [{loop_var}] {i + 1}/{total} ({pct:.0f}%)")
+                write(progress_line(i + 1, ((i + 1) / total) * 100))
 
         # Final progress message
         if show_progress and total % progress_interval != 0:
-            print(f"  [{loop_var}] {total}/{total} (100%)")
+            write(progress_line(total, 100))
 
         # Clear loop context after loop completes
         self.tracer.clear_loop_context()
@@ -580,6 +826,8 @@ class DataflowEngine:
     async def _execute_conditional(
         self,
         step: dict,
+        then_steps: list[tuple[dict, _StepHandler]],
+        else_steps: list[tuple[dict, _StepHandler]],
         context: ExecutionContext,
         errors: list[ErrorRecord],
     ) -> None:
@@ -590,15 +838,12 @@ class DataflowEngine:
 
         # Evaluate condition
         if self._is_truthy(condition):
-            then_steps = cond_config.get("then", [])
             await self._execute_steps(then_steps, context, errors)
-        else:
-            else_steps = cond_config.get("else", [])
-            if else_steps:
-                await self._execute_steps(else_steps, context, errors)
+        elif else_steps:
+            await self._execute_steps(else_steps, context, errors)
 
     def _is_truthy(self, value: Any) -> bool:
         """Determine if a value is truthy."""
         if isinstance(value, str):
-            return value.lower() not in ("false", "no", "0", "")
+            return value.lower() not in _FALSY_STRINGS
         return bool(value)
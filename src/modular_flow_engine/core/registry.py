@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import importlib
+import json
 import pkgutil
 from pathlib import Path
 from typing import Type, TYPE_CHECKING
@@ -85,7 +86,7 @@ class ComponentRegistry:
         component_class = self.get(component_type)
         if component_class is None:
             return None
-        manifest = component_class.describe()
+        manifest = component_class.get_manifest()
         return {
             "type": manifest.type,
             "description": manifest.description,
@@ -165,7 +166,64 @@ def register_component(component_type: str):
     return decorator
 
 
-def auto_discover_components(components_path: Path | str) -> list[str]:
+def _component_module_names(components_path: Path, base_package: str) -> list[str]:
+    """List importable component modules (category/*.py) under a components package."""
+    modules = []
+    for category_dir in components_path.iterdir():
+        if not category_dir.is_dir() or category_dir.name.startswith("_"):
+            continue
+
+        category_package = f"{base_package}.{category_dir.name}"
+        for py_file in category_dir.glob("*.py"):
+            if py_file.name.startswith("_"):
+                continue
+            modules.append(f"{category_package}.{py_file.stem}")
+
+    return sorted(modules)
+
+
+def _directory_signature(components_path: Path) -> dict[str, int]:
+    """
+    Fingerprint the component directory layout.
+
+    Directory mtimes change whenever a file is added, removed or renamed,
+    which is all that affects the module list - no need to stat every file.
+    """
+    signature = {".": components_path.stat().st_mtime_ns}
+    for category_dir in components_path.iterdir():
+        if category_dir.is_dir() and not category_dir.name.startswith("_"):
+            signature[category_dir.name] = category_dir.stat().st_mtime_ns
+    return signature
+
+
+def _load_module_cache(cache_path: Path, components_path: Path, signature: dict[str, int]) -> list[str] | None:
+    """Return cached module names if the cache matches the current layout."""
+    try:
+        cached = json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        return None
+    if cached.get("path") != str(components_path) or cached.get("signature") != signature:
+        return None
+    return cached.get("modules")
+
+
+def _save_module_cache(cache_path: Path, components_path: Path, signature: dict[str, int], modules: list[str]) -> None:
+    """Persist discovered module names (best effort - cache dir may be read-only)."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps({
+            "path": str(components_path),
+            "signature": signature,
+            "modules": modules,
+        }))
+    except OSError:
+        pass
+
+
+def auto_discover_components(
+    components_path: Path | str,
+    cache_path: Path | str | None = None,
+) -> list[str]:
     """
     Auto-discover and register all components in a package.
 
@@ -174,6 +232,8 @@ def auto_discover_components(components_path: Path | str) -> list[str]:
 
     Args:
         components_path: Path to the components package directory
+        cache_path: Optional JSON file caching the discovered module names,
+            reused while the directory layout is unchanged
 
     Returns:
         List of discovered component type strings
@@ -201,25 +261,23 @@ def auto_discover_components(components_path: Path | str) -> list[str]:
     discovered = []
     before = set(ComponentRegistry.get_instance().list_types())
 
-    # Walk through all subpackages
-    for category_dir in components_path.iterdir():
-        if not category_dir.is_dir() or category_dir.name.startswith("_"):
-            continue
-
-        category_package = f"{base_package}.{category_dir.name}"
-
-        # Import all .py files in category
-        for py_file in category_dir.glob("*.py"):
-            if py_file.name.startswith("_"):
-                continue
-
-            module_name = py_file.stem
-            full_module = f"{category_package}.{module_name}"
-
-            try:
-                importlib.import_module(full_module)
-            except Exception as e:
-                print(f"[Warning] Failed to import {full_module}: {e}")
+    # Resolve module names from the cache when the layout hasn't changed
+    modules = None
+    if cache_path is not None:
+        cache_path = Path(cache_path)
+        signature = _directory_signature(components_path)
+        modules = _load_module_cache(cache_path, components_path, signature)
+
+    if modules is None:
+        modules = _component_module_names(components_path, base_package)
+        if cache_path is not None:
+            _save_module_cache(cache_path, components_path, signature, modules)
+
+    for full_module in modules:
+        try:
+            importlib.import_module(full_module)
+        except Exception as e:
+            print(f"[Warning] Failed to import {full_module}: {e}")
 
     after = set(ComponentRegistry.get_instance().list_types())
     discovered = list(after - before)
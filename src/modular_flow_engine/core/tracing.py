@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, NamedTuple
 from enum import Enum
 
 
@@ -73,6 +73,16 @@ class ExecutionTrace:
         return "\n".join(lines)
 
 
+class _PendingTrace(NamedTuple):
+    """Start of a step that only becomes an ExecutionTrace if it fails."""
+    step_index: int
+    step_type: str
+    component_id: str | None
+    timestamp: float
+    inputs: dict[str, Any] | None
+    loop_context: dict[str, Any]
+
+
 @dataclass
 class ExecutionTracer:
     """Collects execution traces during plan execution."""
@@ -94,8 +104,23 @@ class ExecutionTracer:
         step_type: str,
         component_id: str | None = None,
         inputs: dict[str, Any] | None = None,
-    ) -> ExecutionTrace:
+    ) -> ExecutionTrace | _PendingTrace:
         """Start tracing a step."""
+        if self.level in (TraceLevel.NONE, TraceLevel.ERRORS):
+            # Successful steps aren't kept at these levels, so only record
+            # enough to build the trace if the step fails. The loop context
+            # dict is replaced, never mutated, so it's safe to hold on to.
+            pending = _PendingTrace(
+                self._step_counter,
+                step_type,
+                component_id,
+                time.time(),
+                inputs,
+                self._current_loop_context,
+            )
+            self._step_counter += 1
+            return pending
+
         trace = ExecutionTrace(
             step_index=self._step_counter,
             step_type=step_type,
@@ -109,12 +134,24 @@ class ExecutionTracer:
 
     def end_step(
         self,
-        trace: ExecutionTrace,
+        trace: ExecutionTrace | _PendingTrace,
         outputs: dict[str, Any] | None = None,
         error: Exception | None = None,
         recovered: bool = False,
     ) -> None:
         """Complete a step trace."""
+        if isinstance(trace, _PendingTrace):
+            if error is None or self.level == TraceLevel.NONE:
+                return
+            trace = ExecutionTrace(
+                step_index=trace.step_index,
+                step_type=trace.step_type,
+                component_id=trace.component_id,
+                timestamp=trace.timestamp,
+                inputs=trace.inputs or {},
+                loop_context=dict(trace.loop_context),
+            )
+
         trace.duration_ms = (time.time() - trace.timestamp) * 1000
         trace.outputs = outputs or {}
 
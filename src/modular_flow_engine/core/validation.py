@@ -182,7 +182,7 @@ class PlanValidator:
                 )
             else:
                 # Store output types for this component
-                manifest = comp_class.describe()
+                manifest = comp_class.get_manifest()
                 self._component_outputs[comp_id] = {
                     name: self._parse_type(spec.type)
                     for name, spec in manifest.outputs.items()
@@ -208,11 +208,13 @@ class PlanValidator:
                 self._validate_loop_step(step, step_path, components)
             elif "conditional" in step:
                 self._validate_conditional_step(step, step_path, components)
+            elif "parallel" in step:
+                self._validate_parallel_step(step, step_path, components)
             else:
                 self._add_error(
                     f"Unknown step type: {list(step.keys())}",
                     location=step_path,
-                    suggestion="Use 'source', 'call', 'sink', 'loop', or 'conditional'"
+                    suggestion="Use 'source', 'call', 'sink', 'loop', 'conditional', or 'parallel'"
                 )
 
     def _validate_source_step(self, step: dict, path: str, components: dict) -> None:
@@ -328,6 +330,20 @@ class PlanValidator:
         if "else" in cond_config:
             self._validate_steps(cond_config["else"], f"{path}.conditional.else", components)
 
+    def _validate_parallel_step(self, step: dict, path: str, components: dict) -> None:
+        """Validate a parallel step."""
+        branches = step["parallel"]
+
+        if not isinstance(branches, list):
+            self._add_error(
+                "Parallel step must be a list of steps",
+                location=f"{path}.parallel",
+                suggestion="Use 'parallel': [step, step, ...]"
+            )
+            return
+
+        self._validate_steps(branches, f"{path}.parallel", components)
+
     def _validate_reference(self, value: Any, location: str) -> None:
         """Validate a variable reference."""
         if not isinstance(value, str):
@@ -314,6 +314,7 @@ from .core import (
     validate_flow,
     OutputMode,
 )
+from .core.context import encode_json
 
 
 def setup_logging(output_mode: OutputMode) -> None:
@@ -399,7 +400,7 @@ async def run_flow(
     # Show components
     logger.info(f"Components: {len(engine.components)}")
     for comp_id, comp in engine.components.items():
-        manifest = comp.describe()
+        manifest = comp.get_manifest()
         logger.debug(f"  - {comp_id}: {manifest.type}")
 
     # Enhanced validation
@@ -472,23 +473,23 @@ async def run_flow(
 
     # Save full results
     results_file = output_dir / "results.json"
-    with open(results_file, "w") as f:
-        json.dump({
-            "flow_name": flow_name,
-            "success": result.success,
-            "duration_seconds": result.duration_seconds,
-            "stats": result.stats,
-            "returns": result.returns,
-            "errors": [
-                {
-                    "type": e.error_type,
-                    "message": e.message,
-                    "recovered": e.recovered,
-                    "recovery_action": e.recovery_action,
-                }
-                for e in result.errors
-            ],
-        }, f, indent=2, default=str)
+    # Encoded once as UTF-8 bytes (orjson when installed) and written in one go
+    results_file.write_bytes(encode_json({
+        "flow_name": flow_name,
+        "success": result.success,
+        "duration_seconds": result.duration_seconds,
+        "stats": result.stats,
+        "returns": result.returns,
+        "errors": [
+            {
+                "type": e.error_type,
+                "message": e.message,
+                "recovered": e.recovered,
+                "recovery_action": e.recovery_action,
+            }
+            for e in result.errors
+        ],
+    }))
 
     print(f"\nResults saved to: {output_dir}")
 
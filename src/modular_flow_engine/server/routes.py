@@ -372,7 +372,7 @@ async def get_component_schema(category: str, name: str) -> ComponentSchema:
     if comp_class is None:
         raise HTTPException(status_code=404, detail=f"Component '{comp_type}' not found")
 
-    manifest = comp_class.describe()
+    manifest = comp_class.get_manifest()
 
     return ComponentSchema(
         type=manifest.type,